@@ -20,11 +20,26 @@ setup(
     package_dir={'': 'src'},
     install_requires=[
         "beautifulsoup4>=4.11.1",
+        "cssselect>=1.2.0",
+        "lxml>=4.9.2",
         "numpy>=1.24.0",
         "requests>=2.28.1",
     ],
+    extras_require={
+        "speedups": [
+            "brotli",
+            "numba",
+            "orjson",
+        ],
+        "async": [
+            "httpx[http2]",
+        ],
+        "pandas": [
+            "pandas",
+        ],
+    },
     setup_requires=['pytest-runner', 'flake8'],
-    tests_require=['pytest'],
+    tests_require=['pytest', 'pytest-xdist', 'requests-cache', 'vcrpy'],
     project_urls={
         # "Documentation": "#TODO",
         "Source": "https://github.com/JakubPolanowski/PY-Realty",
@@ -1,6 +1,6 @@
 import json
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from numbers import Number
 from typing import Dict, Any, Tuple, List
 from datetime import datetime
@@ -14,7 +14,7 @@ class Sale:
 
     Attribute:
         url (str): The detail URL that this class has parsed
-        soup (BeautifulSoup): The html content of this page parsed to a soup object
+        soup (BeautifulSoup): The html content of this page parsed to a soup object. Only the __NEXT_DATA__ script is kept, the rest of the page is not parsed
 
         ndata (Dict): The __NEXT_DATA__ data dictionary pulled from the html soup
         initial_state (Dict): The initial state dictionary component of ndata
@@ -64,6 +64,9 @@ class Sale:
 
     """
 
+    # the __NEXT_DATA__ script is the only element of the page that is used
+    _NEXT_DATA_STRAINER = SoupStrainer("script", id="__NEXT_DATA__")
+
     def __init__(self, url: str) -> None:
         """This initializes the Preload_Detail_Page object, which call a GET request on the Zillow detail URL. 
 
@@ -74,7 +77,8 @@ class Sale:
         self.url = url
 
         # get soup
-        self.soup = self.make_soup(self.get_page(self.url))
+        self.soup = self.make_soup(
+            self.get_page(self.url), parse_only=self._NEXT_DATA_STRAINER)
 
         # get ndata
         self.ndata = self.get_next_data(self.soup)
@@ -82,58 +86,62 @@ class Sale:
         # get initialState and propertyDetails
         self.initial_state: Dict[str,
                                  Any] = self.ndata['props']['pageProps']['initialState']
-        self.property_details: Dict[str,
-                                    Any] = self.initial_state['propertyDetails']
+        details = self.initial_state['propertyDetails']
+        self.property_details: Dict[str, Any] = details
 
         # additional important keys
-        self.description: Dict[str, Any] = self.property_details['description']
-        self.location: Dict[str, Any] = self.property_details['location']
+        description = details['description']
+        location = details['location']
+        self.description: Dict[str, Any] = description
+        self.location: Dict[str, Any] = location
 
         # quick access values
 
-        self.property_id: str = self.property_details['property_id']
-        self.listing_date: str = self.property_details['list_date']
-
-        self.status: str = self.property_details['status']
-        self.price: int = self.property_details['list_price']
-        self.price_per_sqft: int = self.property_details['price_per_sqft']
-        self.yearly_property_tax: Number = self.property_details['source']['raw']['tax_amount']
-        self.year_built: int = self.description['year_built']
-        self.open_houses: Any = self.property_details['open_houses']
-
-        self.listing_description: str = self.description['text']
-        self.details: Dict[str, Any] = self.property_details['details']
-        self.beds: int = self.description['beds']
-        self.baths: int = self.description['baths']
-        self.garage: int = self.description['garage']
-        self.interior_sqft: int = self.description['sqft']
-        self.lot_sqft: int = self.description['lot_sqft']
-
-        self.address: Dict[str, Any] = self.location['address']
-        self.city: str = self.address['city']
-        self.state_code: str = self.address['state_code']
-        self.state: str = self.address['state']
-        self.county: str = self.address['county']
-        self.latitude: float = self.address['coordinate']['lat']
-        self.longitude: float = self.address['coordinate']['lon']
-        self.zip: str = self.address['postal_code']
-        self.street_address = f"{self.address['line']}, {self.city}, {self.state_code} {self.zip}"
-        self.fips: str = self.location['county']['fips_code']
-
-        self.hoa_fee: int = self.property_details['hoa'].get('fee', 0)
+        self.property_id: str = details['property_id']
+        self.listing_date: str = details['list_date']
+
+        self.status: str = details['status']
+        self.price: int = details['list_price']
+        self.price_per_sqft: int = details['price_per_sqft']
+        self.yearly_property_tax: Number = details['source']['raw']['tax_amount']
+        self.year_built: int = description['year_built']
+        self.open_houses: Any = details['open_houses']
+
+        self.listing_description: str = description['text']
+        self.details: Dict[str, Any] = details['details']
+        self.beds: int = description['beds']
+        self.baths: int = description['baths']
+        self.garage: int = description['garage']
+        self.interior_sqft: int = description['sqft']
+        self.lot_sqft: int = description['lot_sqft']
+
+        address = location['address']
+        self.address: Dict[str, Any] = address
+        self.city: str = address['city']
+        self.state_code: str = address['state_code']
+        self.state: str = address['state']
+        self.county: str = address['county']
+        coordinate = address['coordinate']
+        self.latitude: float = coordinate['lat']
+        self.longitude: float = coordinate['lon']
+        self.zip: str = address['postal_code']
+        self.street_address = f"{address['line']}, {self.city}, {self.state_code} {self.zip}"
+        self.fips: str = location['county']['fips_code']
+
+        self.hoa_fee: int = details['hoa'].get('fee', 0)
 
         self.property_history: List[Dict[str, Any]
-                                    ] = self.property_details['property_history']
+                                    ] = details['property_history']
         self.tax_history: List[Dict[str, Any]
-                               ] = self.property_details['tax_history']
+                               ] = details['tax_history']
 
-        self.area_market_status: Dict[str, Any] = self.location.get('postal_code', {}).get(
+        self.area_market_status: Dict[str, Any] = location.get('postal_code', {}).get(
             'geo_statistics', {}).get('housing_market')
 
         self.noise: str = self.get_noise_metrics(
             self.latitude, self.longitude).get('local_text', 'Unknown')
 
-        self.schools: Dict[str, Any] = self.property_details['schools']
+        self.schools: Dict[str, Any] = details['schools']
         self.similar = self.get_similar_homes(self.property_id)
 
     @staticmethod
@@ -150,17 +158,20 @@ class Sale:
         return requests.get(url, headers=headers)
 
     @staticmethod
-    def make_soup(page: requests.Response) -> BeautifulSoup:
-        """This is a very simple function that has barely a reason to exist. Just takes the response content and has it parsed by Beautiful Soup via its html parser.
+    def make_soup(page: requests.Response, parse_only: SoupStrainer = None) -> BeautifulSoup:
+        """This is a very simple function that has barely a reason to exist. Just takes the response content (Realtor.com pages are utf-8) and has it parsed by Beautiful Soup via the lxml html parser.
 
         Args:
             page (requests.Response): The GET response from a valid GET requests on the detail URL page
+            parse_only (SoupStrainer, optional): If given, only the elements matching the strainer are kept in the soup, which is much faster for large pages. Defaults to None (full page).
 
         Returns:
             BeautifulSoup: Page HTML parsed as a BeautifulSoup Object
         """
 
-        soup = BeautifulSoup(page.content, "html.parser")
+        # the encoding is given so bs4 does not have to sniff it
+        soup = BeautifulSoup(page.content, "lxml",
+                             from_encoding="utf-8", parse_only=parse_only)
 
         return soup
 
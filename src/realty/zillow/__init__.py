@@ -1,2 +1,3 @@
 from .query import Query
 from .details import scrape_listing, scrape_listings, lazy_scrape_listings
+from .cache import enable_page_cache, disable_page_cache
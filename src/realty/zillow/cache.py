@@ -0,0 +1,110 @@
+import os
+import time
+import shelve
+import threading
+import requests
+
+DEFAULT_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "realty", "zillow_pages")
+# Default location of the page cache file(s)
+
+DEFAULT_TTL = 24 * 60 * 60
+# Seconds a cached page is considered fresh
+
+
+class Page_Cache:
+    """Persistent on disk cache of Zillow page responses keyed by URL, backed by shelve. Pages older than the ttl are treated as missing. This is safe to use from multiple threads of one process.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, ttl: float = DEFAULT_TTL) -> None:
+        """Opens (or creates) the page cache.
+
+        Args:
+            path (str, optional): Path of the shelve file(s). Defaults to DEFAULT_PATH.
+            ttl (float, optional): Seconds a cached page is considered fresh. Defaults to DEFAULT_TTL.
+        """
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        self.path = path
+        self.ttl = ttl
+        self._shelf = shelve.open(path)
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> requests.Response | None:
+        """Gets the cached page response of the URL.
+
+        Args:
+            url (str): The page URL
+
+        Returns:
+            requests.Response | None: The cached response, None if the page is not cached or has expired
+        """
+
+        with self._lock:
+            entry = self._shelf.get(url)
+
+        if entry is None:
+            return None
+
+        stored, page = entry
+        if time.time() - stored > self.ttl:
+            return None
+
+        return page
+
+    def set(self, url: str, page: requests.Response) -> None:
+        """Stores the page response of the URL.
+
+        Args:
+            url (str): The page URL
+            page (requests.Response): The page response
+        """
+
+        with self._lock:
+            self._shelf[url] = (time.time(), page)
+
+    def clear(self) -> None:
+        """Removes every cached page.
+        """
+
+        with self._lock:
+            self._shelf.clear()
+
+    def close(self) -> None:
+        """Writes out and closes the cache.
+        """
+
+        with self._lock:
+            self._shelf.close()
+
+
+PAGE_CACHE: Page_Cache | None = None
+# The active page cache used by the detail page requests, None when disabled
+
+
+def enable_page_cache(path: str = DEFAULT_PATH, ttl: float = DEFAULT_TTL) -> Page_Cache:
+    """Enables the persistent page cache, so that detail pages already fetched (in this or in an earlier session) are read from disk rather than requested again.
+
+    Args:
+        path (str, optional): Path of the cache file(s). Defaults to DEFAULT_PATH.
+        ttl (float, optional): Seconds a cached page is considered fresh. Defaults to DEFAULT_TTL.
+
+    Returns:
+        Page_Cache: The enabled page cache
+    """
+    global PAGE_CACHE
+
+    disable_page_cache()
+    PAGE_CACHE = Page_Cache(path, ttl)
+    return PAGE_CACHE
+
+
+def disable_page_cache() -> None:
+    """Disables (and closes) the persistent page cache, if enabled. The cached pages are kept on disk.
+    """
+    global PAGE_CACHE
+
+    if PAGE_CACHE is not None:
+        PAGE_CACHE.close()
+        PAGE_CACHE = None
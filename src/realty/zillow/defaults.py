@@ -1,9 +1,13 @@
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+
 URL = "https://www.zillow.com/search/GetSearchPageState.htm"
 # The URL for the API request
 
 HEADER = {  # Headers to be passed in the request (required to get results)
     "authority": "www.zillow.com",
     "accept": "*/*",
+    # compressed responses, includes brotli (br) when brotli is installed
+    "accept-encoding": DEFAULT_ACCEPT_ENCODING,
     "accept-language": "en-US,en;q=0.9",
     "sec-fetch-dest": "empty",
     "sec-fetch-mode": "cors",
@@ -12,9 +16,13 @@ HEADER = {  # Headers to be passed in the request (required to get results)
     "user-agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36"
 }
 
+GRAPHQL_URL = "https://www.zillow.com/graphql"
+# The URL for GRAPHQL API requests
+
 GRAPHQL_HEADER = {
     "authority": "www.zillow.com",
     "accept": "*/*",
+    "accept-encoding": DEFAULT_ACCEPT_ENCODING,
     "accept-language": "en-US,en;q=0.7",
     "client-id": "vertical-living",
     "content-type": "application/json",
@@ -25,3 +33,10 @@ GRAPHQL_HEADER = {
     "sec-gpc": "1",
     "user-agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36"
 }
+
+TIMEOUT = 30
+# Seconds to wait on Zillow to respond before giving up on a request
+
+PRELOAD_RANGE_BYTES = 262144
+# Size of the byte window requested from the start of a detail page when only
+# the api preload is needed, the preload is typically within the first 200KB
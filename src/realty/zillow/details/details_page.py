@@ -1,43 +1,124 @@
-import json
+import re
+import asyncio
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from bs4 import BeautifulSoup, SoupStrainer
 from numbers import Number
-from typing import Dict, Any, Tuple, List
-from .. import defaults
+from typing import Dict, Any, Tuple, List, Literal, Iterable
+from .. import defaults, cache
+from ..session import SESSION
+
+try:
+    from orjson import loads as json_loads, dumps as json_dumps
+except ImportError:  # orjson is an optional speedup, fall back to the stdlib
+    import json
+    from json import loads as json_loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# the GRAPHQL payloads are sent as pre-encoded bytes, so the content type is
+# set explicitly (requests only adds it for json=)
+_JSON_CONTENT_TYPE = {"content-type": "application/json"}
+
+try:
+    import httpx
+except ImportError:  # httpx is optional, only needed for the batched async requests
+    httpx = None
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional, only needed for the DataFrame conversions
+    pd = None
+
+# The preload script only contains JSON (no nested tags), so its content can
+# be taken from the raw page bytes without parsing the html
+_PRELOAD_SCRIPT_RE = re.compile(
+    rb'<script[^>]*\bid="hdpApolloPreloadedData"[^>]*>(.*?)</script>', re.DOTALL)
+
+# lot size number (may contain thousands separators) followed by its unit
+_LOT_SIZE_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?|\.\d+)\s*(acres|sqft)', re.IGNORECASE)
+
+# Zillow serves utf-8, without this lxml falls back to latin-1 on raw bytes
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
 
 
 class Details_Page:
     """Static class which contains methods that are more or less generalizable to detail page parsing of Sales, Rental Homes, and Rental Apartments
     """
 
+    __slots__ = ()
+
     @staticmethod
-    def get_page(url: str, headers: Dict = defaults.HEADER) -> requests.Response:
-        """Submits a GET request to the detail URL to get the page.
+    def get_page(url: str, headers: Dict = defaults.HEADER, timeout: Number = defaults.TIMEOUT, session: requests.Session = SESSION, invalidate: bool = False) -> requests.Response:
+        """Submits a GET request to the detail URL to get the page. The request goes through the shared session so the connection to Zillow is reused between pages. If the page cache is enabled (see cache.enable_page_cache), a fresh cached page is returned instead of making the request.
 
         Args:
             url (str): The detail URL. Note that invalid URL will lead to unexpected results and errors
             headers (Dict, optional): The request headers. Incorrect headers may lead to invalid results. It is recommended to leave as default. Defaults to defaults.HEADER.
+            timeout (Number, optional): Seconds to wait for the response. Defaults to defaults.TIMEOUT.
+            session (requests.Session, optional): The session to send the request with. Defaults to the shared session.SESSION.
+            invalidate (bool, optional): If True, the page is requested even if it is cached, and the cached page is replaced. Defaults to False.
 
         Returns:
             requests.Response: The page GET response
         """
-        return requests.get(url, headers=headers)
+        page_cache = cache.PAGE_CACHE
+
+        if page_cache is not None and not invalidate:
+            page = page_cache.get(url)
+            if page is not None:
+                return page
+
+        page = session.get(url, headers=headers, timeout=timeout)
+
+        # partial (range) and failed responses are not cached
+        if page_cache is not None and page.status_code == 200:
+            page_cache.set(url, page)
+
+        return page
 
     @staticmethod
-    def make_soup(page: requests.Response) -> BeautifulSoup:
-        """This is a very simple function that has barely a reason to exist. Just takes the response content and has it parsed by Beautiful Soup via its html parser.
+    def make_soup(page: requests.Response, parse_only: SoupStrainer = None) -> BeautifulSoup:
+        """This is a very simple function that has barely a reason to exist. Just takes the response content (Zillow pages are utf-8) and has it parsed by Beautiful Soup via the lxml html parser.
 
         Args:
             page (requests.Response): The GET response from a valid GET requests on the detail URL page
+            parse_only (SoupStrainer, optional): If given, only the elements matching the strainer are kept in the soup, which is much faster for large pages. Defaults to None (full page).
 
         Returns:
             BeautifulSoup: Page HTML parsed as a BeautifulSoup Object
         """
 
-        soup = BeautifulSoup(page.content, "html.parser")
+        # the encoding is given so bs4 does not have to sniff it
+        soup = BeautifulSoup(page.content, "lxml",
+                             from_encoding="utf-8", parse_only=parse_only)
 
         return soup
 
+    @staticmethod
+    def post_graphql(payload: Dict[str, Any], headers: Dict = defaults.GRAPHQL_HEADER, url: str = defaults.GRAPHQL_URL, timeout: Number = defaults.TIMEOUT, session: requests.Session = SESSION) -> Dict[str, Any]:
+        """Submits a POST request with the given payload to Zillow's GRAPHQL API.
+
+        Args:
+            payload (Dict[str, Any]): The GRAPHQL payload, typically containing the operationName, variables, and query or queryId
+            headers (Dict, optional): The request headers. Defaults to defaults.GRAPHQL_HEADER.
+            url (str, optional): The GRAPHQL API URL. Defaults to defaults.GRAPHQL_URL.
+            timeout (Number, optional): Seconds to wait for the response. Defaults to defaults.TIMEOUT.
+            session (requests.Session, optional): The session to send the request with. Defaults to the shared session.SESSION.
+
+        Returns:
+            Dict[str, Any]: The response JSON
+        """
+        response = session.post(
+            url, data=json_dumps(payload), headers={**_JSON_CONTENT_TYPE, **headers}, timeout=timeout)
+
+        return json_loads(response.content)
+
     @staticmethod
     def get_walk_and_bike_score(zpid: str) -> Dict[str, Any]:
         """Gets the walk and bike details that appears on the Zillow details page
@@ -49,19 +130,63 @@ class Details_Page:
             Dict[str, Any]: Walk and bike score response dictionary
         """
 
-        url = "https://www.zillow.com/graphql"
+        return Details_Page.post_graphql(
+            Details_Page._walk_and_bike_score_payload(zpid), headers=defaults.HEADER)['data']
+
+    @staticmethod
+    async def get_walk_and_bike_score_async(zpid: str, client: 'httpx.AsyncClient') -> Dict[str, Any]:
+        """Async version of get_walk_and_bike_score, sending the request through the given httpx client.
+
+        Args:
+            zpid (str): The Zillow property ID.
+            client (httpx.AsyncClient): The httpx client to send the request with. Requires httpx to be installed.
+
+        Returns:
+            Dict[str, Any]: Walk and bike score response dictionary
+        """
+
+        response = await client.post(
+            defaults.GRAPHQL_URL, content=json_dumps(Details_Page._walk_and_bike_score_payload(zpid)),
+            headers={**_JSON_CONTENT_TYPE, **defaults.HEADER}, timeout=defaults.TIMEOUT
+        )
+
+        return json_loads(response.content)['data']
+
+    @staticmethod
+    def get_walk_and_bike_scores(zpids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Gets the walk and bike details of many properties at once. The requests are sent concurrently and multiplexed over a single HTTP/2 connection. Requires httpx (with http2 support) to be installed, see the async extra. NOTE: this starts its own event loop, from within a running event loop use get_walk_and_bike_score_async instead.
 
-        payload = {
+        Args:
+            zpids (Iterable[str]): The Zillow property IDs.
+
+        Raises:
+            ImportError: httpx is not installed
+
+        Returns:
+            List[Dict[str, Any]]: Walk and bike score response dictionaries, in the same order as zpids
+        """
+
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for batched requests, install with pip install .[async]")
+
+        async def fetch_all():
+            async with httpx.AsyncClient(http2=True) as client:
+                return await asyncio.gather(*(
+                    Details_Page.get_walk_and_bike_score_async(zpid, client) for zpid in zpids
+                ))
+
+        return asyncio.run(fetch_all())
+
+    @staticmethod
+    def _walk_and_bike_score_payload(zpid: str) -> Dict[str, Any]:
+        return {
             "clientVersion": "home-details/6.1.1569.master.099cd8a",
             "operationName": "WalkTransitAndBikeScoreQuery",
             "query": "query WalkTransitAndBikeScoreQuery($zpid: ID!) {\n  property(zpid: $zpid) {\n    id\n    walkScore {\n      walkscore\n      description\n      ws_link\n    }\n    transitScore {\n      transit_score\n      description\n      ws_link\n    }\n    bikeScore {\n      bikescore\n      description\n    }\n  }\n}\n",
             "variables": {"zpid": zpid}
         }
 
-        return requests.request(
-            "POST", url, json=payload, headers=defaults.HEADER
-        ).json()['data']
-
     @classmethod
     def parse_lot_size(cls, lot_size: str) -> Number:
         """Parses lot size string to sqft. Assumes that lot size will follow format of 'x Acres' or 'x.x Acres'.
@@ -75,19 +200,19 @@ class Details_Page:
         if not lot_size:
             return None
 
-        lot_size = lot_size.lower()
+        match = _LOT_SIZE_RE.search(lot_size)
 
-        if 'acres' in lot_size:
-            acres = float(lot_size.replace(
-                "acres", "").replace(",", "").strip())
-            return cls.calculate_acres_to_sqft(acres)
-        elif "sqft" in lot_size:
-            sqft = float(lot_size.replace("sqft", "").replace(",", "").strip())
-            return sqft
-        else:
+        if not match:
             raise ValueError(
                 f"Expected to find 'acres' or 'sqft' but found neither - {lot_size}")
 
+        size = float(match.group(1).replace(",", ""))
+
+        if match.group(2).lower() == 'acres':
+            return cls.calculate_acres_to_sqft(size)
+        else:
+            return size
+
     @staticmethod
     def calculate_acres_to_sqft(acres: Number) -> Number:
         """Converts acres to sqft. 
@@ -105,6 +230,8 @@ class Details_Page:
 
 class NextJS_Detail_Page(Details_Page):
 
+    __slots__ = ()
+
     @staticmethod
     def get_next_data(soup: BeautifulSoup) -> Dict[Any, Any]:
         """Extracts and parses the NEXT_DATA cache from the page soup.
@@ -117,7 +244,7 @@ class NextJS_Detail_Page(Details_Page):
         """
 
         ndata = soup.find("script", id="__NEXT_DATA__").text
-        ndata = json.loads(ndata)
+        ndata = json_loads(ndata)
 
         return ndata
 
@@ -138,108 +265,449 @@ class NextJS_Detail_Page(Details_Page):
 
 class Preload_Detail_Page(Details_Page):
 
-    def __init__(self, url: str) -> None:
+    # compiled selectors of the html lookups, shared by all instances. The css
+    # is translated to xpath once at import rather than on every lookup.
+    # Subclasses extend this with their own page specific selectors
+    _SELECTORS: Dict[str, etree.XPath] = {
+        'facts_and_features': CSSSelector("div.jCOrgb"),
+        'facts_and_features_title': etree.XPath("string((.//h5)[1])"),
+        'facts_and_features_subsections': etree.XPath(".//div"),
+        'facts_and_features_subsection_title': etree.XPath("string((.//h6)[1])"),
+        'facts_and_features_items': etree.XPath("(.//ul)[1]//li"),
+    }
+
+    def __init__(self, url: str, page: requests.Response = None, preload_only: bool = False, lazy: bool = False) -> None:
         """This initializes the Preload_Detail_Page object, which call a GET request on the Zillow detail URL. 
 
         Args:
             url (str): The Zillow Property Sale details URL.
+            page (requests.Response, optional): The already fetched GET response of the detail URL, if given no GET request is made. Defaults to None.
+            preload_only (bool, optional): If only the api preload is needed, in which case only the first defaults.PRELOAD_RANGE_BYTES of the page are requested (falling back to the full page if the preload is not within them). NOTE: the html based attributes (soup, tree, facts_and_features, likely_to_sell) may then be incomplete. Defaults to False.
+            lazy (bool, optional): If True, the GET request and the parsing of the preload are deferred until an attribute that needs them is first accessed, so the object is created immediately. Note that any request or parsing errors are then also raised on that first access. Defaults to False.
         """
 
         self.url = url
+        self.preload_only = preload_only
 
-        # get soup
-        self.soup = self.make_soup(self.get_page(self.url))
+        if page is not None:
+            self.page = page
 
-        # get api preload
-        self.preload = self.get_api_preload(self.soup)
-        self.zpid: int = self.preload['zpid']
+        if not lazy:
+            self.property
 
-        # get caches
-        self.variant_cache, self.full_cache = self.get_variant_and_full_from_preload(
-            self.preload)
+    @cached_property
+    def page(self) -> requests.Response:
+        if self.preload_only:
+            return self.get_page(self.url, headers={
+                **defaults.HEADER, "range": f"bytes=0-{defaults.PRELOAD_RANGE_BYTES - 1}"})
 
-        # quick access values
-        self.property: Dict[Any, Any] = self.full_cache['property']
+        return self.get_page(self.url)
 
-        self.home_type: str = self.property['homeType']
-        self.year_built: int = self.property['yearBuilt']
+    @cached_property
+    def preload(self) -> Dict[Any, Any]:
+        try:
+            return self.get_api_preload_from_page(self.page)
+        except ValueError:
+            if self.page.status_code != 206:  # not a partial page
+                raise
 
-        self.price: int = self.property['price']
-        self.zestimate: int = self.property['zestimate']
-        self.rental_zestimate: int = self.property['rentZestimate']
-        self.tax_history: List[Dict[str, Number]] = self.property['taxHistory']
-        self.price_history: List[Dict[str, Any]
-                                 ] = self.property['priceHistory']
-        self.currency: str = self.property['currency']
+            # preload is past the requested byte range, get the whole page
+            self.page = self.get_page(self.url)
+            return self.get_api_preload_from_page(self.page)
 
-        self.status: str = self.property['homeStatus']
-        self.days_on_zillow: int = self.property['daysOnZillow']
-        self.views: int = self.property['pageViewCount']
-        self.saves: int = self.property['favoriteCount']
+    @cached_property
+    def zpid(self) -> int:
+        return self.preload['zpid']
 
-        self.tags: List[str] = self.get_tags()
-        self.description: str = self.property['description']
+    @cached_property
+    def full_cache(self) -> Dict[Any, Any]:
+        return self.get_cache_from_preload(self.preload, 'Full')
 
-        self.address: Dict[str, Any] = self.property['address']
-        self.street_address: str = self.address['streetAddress']
-        self.city: str = self.address['city']
-        self.state: str = self.address['state']
-        self.zip: str = self.address['zipcode']
-        self.latitude: float = self.property['latitude']
-        self.longitutde: float = self.property['longitude']
+    @cached_property
+    def property(self) -> Dict[Any, Any]:
+        return self.full_cache['property']
 
-        self.bedrooms: Number = self.property['bedrooms']
-        self.bathrooms: Number = self.property['bathrooms']
+    @classmethod
+    def bulk(cls, urls: Iterable[str], max_workers: int = 16) -> List['Preload_Detail_Page']:
+        """Fetches and parses many detail URLs at once. The page GET requests are made concurrently in a thread pool, which is where nearly all of the time is spent, then each page is parsed into an instance of this class.
 
-        self.interior_sqft: Number = self.property['livingArea']
+        Args:
+            urls (Iterable[str]): The Zillow detail URLs
+            max_workers (int, optional): The maximum number of concurrent requests. Keep in mind that Zillow may block scraping if too many requests are made in rapid succession. Defaults to 16.
 
-        self.appliances: List[str] = self.property['resoFacts']['appliances']
-        self.cooling: List[str] = self.property['resoFacts']['cooling']
-        self.heating: List[str] = self.property['resoFacts']['heating']
-        self.community_features: List[str] = self.property['resoFacts']['communityFeatures']
-        self.fireplaces: Number = self.property['resoFacts']['fireplaces']
-        self.garage: bool = self.property['resoFacts']['hasGarage']
-        self.interior_features: List[str] = self.property['resoFacts']['interiorFeatures']
+        Returns:
+            List[Preload_Detail_Page]: List of instances of this class (for example Sale), in the same order as urls
+        """
 
-        self.attic: str | None = self.property['resoFacts']['attic']
-        self.basement: str | None = self.property['resoFacts']['basement']
+        urls = list(urls)
 
-        self.hoa_fee: Number | None = self.property['resoFacts']['hoaFee']
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = executor.map(cls.get_page, urls)
 
-        self.levels: str | None = self.property['resoFacts']['levels']
+            return [cls(url, page=page) for url, page in zip(urls, pages)]
 
-        self.parking: List[str] | None = self.property['resoFacts']['parkingFeatures']
-        self.lot_features: List[str] | None = self.property['resoFacts']['lotFeatures']
-        self.lot_size: str | None = self.property['resoFacts']['lotSize']
-        self.lot_size_dimensions: str = self.property['resoFacts'].get(
-            'lotSizeDimensions', None)
-        self.lot_sqft: Number = self.parse_lot_size(self.lot_size)
+    @staticmethod
+    def prefetch_walk_and_bike_scores(pages: Iterable['Preload_Detail_Page']) -> None:
+        """Requests the walk and bike scores of many pages at once (see get_walk_and_bike_scores) and caches them as each page's walk_and_bike_score attribute. Requires httpx to be installed.
 
-        self.sewer: List[str] | None = self.property['resoFacts']['sewer']
-        self.water_source: List[str] | None = self.property['resoFacts']['waterSource']
+        Args:
+            pages (Iterable[Preload_Detail_Page]): The detail pages, for example the result of bulk
+        """
 
-        self.attribution: Dict[str, Any] = self.property['attributionInfo']
+        pages = list(pages)
+        scores = Preload_Detail_Page.get_walk_and_bike_scores(
+            [p.zpid for p in pages])
 
-        self.schools: List[Dict[str, Any]] = self.property['schools']
-        self.similar: List[Dict[str, Any]] = self.property['comps']
-        self.nearby: List[Dict[str, Any]] = self.property['nearbyHomes']
+        for page, score in zip(pages, scores):
+            page.__dict__['walk_and_bike_score'] = score
 
     @staticmethod
-    def get_api_preload(soup: BeautifulSoup) -> Dict[Any, Any]:
-        """Extracts and parses the API preload cache from the page soup.
+    def history_to_dataframe(history: List[Dict[str, Any]]) -> 'pd.DataFrame':
+        """Converts a history list of dictionaries (such as tax_history or price_history) to a DataFrame with one column per key. Requires pandas to be installed.
 
         Args:
-            soup (BeautifulSoup): The html page soup object
+            history (List[Dict[str, Any]]): The history list
+
+        Raises:
+            ImportError: pandas is not installed
+
+        Returns:
+            pd.DataFrame: The history as a DataFrame
+        """
+
+        if pd is None:
+            raise ImportError(
+                "pandas is required for DataFrame conversions, install with pip install .[pandas]")
+
+        return pd.DataFrame.from_records(history or [])
+
+    @staticmethod
+    def concat_tax_history(pages: Iterable['Preload_Detail_Page']) -> 'pd.DataFrame':
+        """Combines the tax history of many pages into a single DataFrame, with a zpid column identifying the property of each row. Requires pandas to be installed.
+
+        Args:
+            pages (Iterable[Preload_Detail_Page]): The detail pages, for example the result of bulk
+
+        Returns:
+            pd.DataFrame: The combined tax history
+        """
+        return Preload_Detail_Page._concat_history(pages, 'tax_history_df')
+
+    @staticmethod
+    def concat_price_history(pages: Iterable['Preload_Detail_Page']) -> 'pd.DataFrame':
+        """Combines the price history of many pages into a single DataFrame, with a zpid column identifying the property of each row. Requires pandas to be installed.
+
+        Args:
+            pages (Iterable[Preload_Detail_Page]): The detail pages, for example the result of bulk
+
+        Returns:
+            pd.DataFrame: The combined price history
+        """
+        return Preload_Detail_Page._concat_history(pages, 'price_history_df')
+
+    @staticmethod
+    def _concat_history(pages: Iterable['Preload_Detail_Page'], attribute: str) -> 'pd.DataFrame':
+        frames = [getattr(p, attribute).assign(zpid=p.zpid) for p in pages]
+
+        if not frames:
+            return Preload_Detail_Page.history_to_dataframe([])
+
+        return pd.concat(frames, ignore_index=True)
+
+    @cached_property
+    def variant_cache(self) -> Dict[Any, Any]:
+        return self.get_cache_from_preload(self.preload, 'Variant')
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        # the api preload is extracted without a soup, so the full page is
+        # only parsed by Beautiful Soup if it is actually needed
+        return self.make_soup(self.page)
+
+    @cached_property
+    def tree(self) -> lxml.html.HtmlElement:
+        # lxml tree of the page for the html lookups, which are done in C
+        # rather than by walking the python soup
+        return lxml.html.fromstring(self.page.content, parser=_HTML_PARSER)
+
+    # The remaining quick access values are lazily evaluated, as most callers
+    # will only ever read a handful of them. See the Sale and Rental_Home class
+    # docstrings for descriptions.
+
+    @cached_property
+    def home_type(self) -> str:
+        return self.property['homeType']
+
+    @cached_property
+    def year_built(self) -> int:
+        return self.property['yearBuilt']
+
+    @cached_property
+    def price(self) -> int:
+        return self.property['price']
+
+    @cached_property
+    def zestimate(self) -> int:
+        return self.property['zestimate']
+
+    @cached_property
+    def rental_zestimate(self) -> int:
+        return self.property['rentZestimate']
+
+    @cached_property
+    def tax_history(self) -> List[Dict[str, Number]]:
+        return self.property['taxHistory']
+
+    @cached_property
+    def price_history(self) -> List[Dict[str, Any]]:
+        return self.property['priceHistory']
+
+    @cached_property
+    def tax_history_df(self) -> 'pd.DataFrame':
+        return self.history_to_dataframe(self.tax_history)
+
+    @cached_property
+    def price_history_df(self) -> 'pd.DataFrame':
+        return self.history_to_dataframe(self.price_history)
+
+    @cached_property
+    def currency(self) -> str:
+        return self.property['currency']
+
+    @cached_property
+    def status(self) -> str:
+        return self.property['homeStatus']
+
+    @cached_property
+    def days_on_zillow(self) -> int:
+        return self.property['daysOnZillow']
+
+    @cached_property
+    def views(self) -> int:
+        return self.property['pageViewCount']
+
+    @cached_property
+    def saves(self) -> int:
+        return self.property['favoriteCount']
+
+    @cached_property
+    def tags(self) -> List[str]:
+        return self.get_tags()
+
+    @cached_property
+    def description(self) -> str:
+        return self.property['description']
+
+    @cached_property
+    def address(self) -> Dict[str, Any]:
+        return self.property['address']
+
+    @cached_property
+    def street_address(self) -> str:
+        return self.address['streetAddress']
+
+    @cached_property
+    def city(self) -> str:
+        return self.address['city']
+
+    @cached_property
+    def state(self) -> str:
+        return self.address['state']
+
+    @cached_property
+    def zip(self) -> str:
+        return self.address['zipcode']
+
+    @cached_property
+    def latitude(self) -> float:
+        return self.property['latitude']
+
+    @cached_property
+    def longitutde(self) -> float:
+        return self.property['longitude']
+
+    @cached_property
+    def bedrooms(self) -> Number:
+        return self.property['bedrooms']
+
+    @cached_property
+    def bathrooms(self) -> Number:
+        return self.property['bathrooms']
+
+    @cached_property
+    def interior_sqft(self) -> Number:
+        return self.property['livingArea']
+
+    @cached_property
+    def reso_facts(self) -> Dict[str, Any]:
+        return self.property['resoFacts']
+
+    @cached_property
+    def appliances(self) -> List[str]:
+        return self.reso_facts['appliances']
+
+    @cached_property
+    def cooling(self) -> List[str]:
+        return self.reso_facts['cooling']
+
+    @cached_property
+    def heating(self) -> List[str]:
+        return self.reso_facts['heating']
+
+    @cached_property
+    def community_features(self) -> List[str]:
+        return self.reso_facts['communityFeatures']
+
+    @cached_property
+    def fireplaces(self) -> Number:
+        return self.reso_facts['fireplaces']
+
+    @cached_property
+    def garage(self) -> bool:
+        return self.reso_facts['hasGarage']
+
+    @cached_property
+    def interior_features(self) -> List[str]:
+        return self.reso_facts['interiorFeatures']
+
+    @cached_property
+    def attic(self) -> str | None:
+        return self.reso_facts['attic']
+
+    @cached_property
+    def basement(self) -> str | None:
+        return self.reso_facts['basement']
+
+    @cached_property
+    def hoa_fee(self) -> Number | None:
+        return self.reso_facts['hoaFee']
+
+    @cached_property
+    def levels(self) -> str | None:
+        return self.reso_facts['levels']
+
+    @cached_property
+    def parking(self) -> List[str] | None:
+        return self.reso_facts['parkingFeatures']
+
+    @cached_property
+    def lot_features(self) -> List[str] | None:
+        return self.reso_facts['lotFeatures']
+
+    @cached_property
+    def lot_size(self) -> str | None:
+        return self.reso_facts['lotSize']
+
+    @cached_property
+    def lot_size_dimensions(self) -> str:
+        return self.reso_facts.get('lotSizeDimensions', None)
+
+    @cached_property
+    def lot_sqft(self) -> Number:
+        return self.parse_lot_size(self.lot_size)
+
+    @cached_property
+    def sewer(self) -> List[str] | None:
+        return self.reso_facts['sewer']
+
+    @cached_property
+    def water_source(self) -> List[str] | None:
+        return self.reso_facts['waterSource']
+
+    @cached_property
+    def attribution(self) -> Dict[str, Any]:
+        return self.property['attributionInfo']
+
+    @cached_property
+    def schools(self) -> List[Dict[str, Any]]:
+        return self.property['schools']
+
+    @cached_property
+    def similar(self) -> List[Dict[str, Any]]:
+        return self.property['comps']
+
+    @cached_property
+    def nearby(self) -> List[Dict[str, Any]]:
+        return self.property['nearbyHomes']
+
+    @cached_property
+    def at_a_glance(self) -> Dict[str, Any]:
+        return self.get_at_a_glance()
+
+    @cached_property
+    def facts_and_features(self) -> Dict[str, Any]:
+        return self.get_facts_and_features()
+
+    @cached_property
+    def walk_and_bike_score(self) -> Dict[str, Any]:
+        return self.get_walk_and_bike_score(self.zpid)
+
+    @staticmethod
+    def get_api_preload(soup: BeautifulSoup | bytes) -> Dict[Any, Any]:
+        """Extracts and parses the API preload cache from the page soup. The raw page content (bytes) can also be given, in which case the preload script is located with a regex instead of a soup search, which avoids parsing the html entirely.
+
+        Args:
+            soup (BeautifulSoup | bytes): The html page soup object or the raw page content
+
+        Raises:
+            ValueError: The page content does not contain the API preload script
 
         Returns:
             Dict[Any, Any]: The api preload cache dictionary
         """
 
-        preload = soup.find("script", id="hdpApolloPreloadedData").text
-        preload = json.loads(preload)
-        preload['apiCache'] = json.loads(preload['apiCache'])
+        if isinstance(soup, bytes):
+            match = _PRELOAD_SCRIPT_RE.search(soup)
+            if not match:
+                raise ValueError(
+                    "Could not find the API preload script in page")
+
+            preload = match.group(1)
+        else:
+            preload = soup.find("script", id="hdpApolloPreloadedData").text
+
+        preload = json_loads(preload)
+        preload['apiCache'] = json_loads(preload['apiCache'])
         return preload
 
+    @staticmethod
+    def get_api_preload_from_page(page: requests.Response) -> Dict[Any, Any]:
+        """Extracts and parses the API preload cache directly from the page response. This does not require the page to be parsed into a soup, instead the preload script is located in the raw page bytes and its JSON is parsed straight from those bytes (see get_api_preload).
+
+        Args:
+            page (requests.Response): The GET response from a valid GET requests on the detail URL page
+
+        Raises:
+            ValueError: The page does not contain the API preload script
+
+        Returns:
+            Dict[Any, Any]: The api preload cache dictionary
+        """
+
+        return Preload_Detail_Page.get_api_preload(page.content)
+
+    @staticmethod
+    def get_cache_from_preload(preload: Dict[Any, Any], cache: Literal['Variant', 'Full']) -> Dict[Any, Any]:
+        """Gets either the variant or the full API cache from the preload dictionary.
+
+        Args:
+            preload (Dict[Any, Any]): The preload dictionary obtained via get_api_preload
+            cache (Literal['Variant', 'Full']): Which api cache to get
+
+        Raises:
+            KeyError: Requested cache missing from apiCache
+
+        Returns:
+            Dict[Any, Any]: The requested api cache dictionary
+        """
+
+        for k in preload['apiCache']:
+            if cache in k:
+                return preload['apiCache'][k]
+
+        raise KeyError(
+            f"Expected {cache} key in apiCache dictionary of preload dictionary")
+
     @staticmethod
     def get_variant_and_full_from_preload(preload: Dict[Any, Any]) -> Tuple[Dict[Any, Any], Dict[Any, Any]]:
         """Gets the variant and full API caches from the preload dictionary.
@@ -248,20 +716,29 @@ class Preload_Detail_Page(Details_Page):
             preload (Dict[Any, Any]): The preload dictionary obtained via get_api_preload
 
         Raises:
-            KeyError: Unexpected key within apiCache
+            KeyError: Variant or Full key missing from apiCache
 
         Returns:
             Tuple[Dict[Any, Any], Dict[Any, Any]]: variant api cache dictionary, full api cache dictionary
         """
 
-        for k in preload['apiCache'].keys():
+        var_key = full_key = None
+
+        # unrelated keys are ignored, only the variant and full keys are needed
+        for k in preload['apiCache']:
             if 'Variant' in k:
                 var_key = k
             elif 'Full' in k:
                 full_key = k
             else:
-                raise KeyError(
-                    "Unexpected key in apiCache dictionary of preload dictionary")
+                continue
+
+            if var_key is not None and full_key is not None:
+                break
+
+        if var_key is None or full_key is None:
+            raise KeyError(
+                "Expected Variant and Full keys in apiCache dictionary of preload dictionary")
 
         return preload['apiCache'][var_key], preload['apiCache'][full_key]
 
@@ -272,16 +749,9 @@ class Preload_Detail_Page(Details_Page):
             Dict[str, Any]: Returns a dictionary of the at a glance facts.
         """
 
-        at_a_glance_dict = self.property['resoFacts']['atAGlanceFacts']
-
-        if at_a_glance_dict:
-            glance = {}
-            for pair in at_a_glance_dict:
-                glance[pair['factLabel']] = pair['factValue']
-
-            return glance
-        else:
-            return {}
+        return {
+            pair['factLabel']: pair['factValue'] for pair in self.reso_facts['atAGlanceFacts'] or ()
+        }
 
     def get_tags(self) -> List[str]:
         """Gets the taglines on the page
@@ -307,8 +777,12 @@ class Preload_Detail_Page(Details_Page):
             Dict[str, Any]: Facts and features dictionary
         """
 
-        return {tag.h5.text: {
-            stag.h6.text: [
-                li.text for li in stag.ul.find_all('li')
-            ] for stag in tag.find_all("div")
-        } for tag in self.soup.find_all("div", "jCOrgb")}
+        sel = self._SELECTORS
+        title, subsections = sel['facts_and_features_title'], sel['facts_and_features_subsections']
+        sub_title, items = sel['facts_and_features_subsection_title'], sel['facts_and_features_items']
+
+        return {title(tag): {
+            sub_title(stag): [
+                li.text_content() for li in items(stag)
+            ] for stag in subsections(tag)
+        } for tag in sel['facts_and_features'](self.tree)}
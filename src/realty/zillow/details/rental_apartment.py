@@ -1,19 +1,86 @@
 # This handles parsing of rental apartments data
-import requests
+from operator import itemgetter
 from typing import Dict, Any, List
-from numbers import Number
+from bs4 import SoupStrainer
 from .details_page import NextJS_Detail_Page
-from .. import defaults
 
 
 class Rental_Apartment(NextJS_Detail_Page):
 
+    # the eagerly assigned attributes live in slots, __dict__ is kept as
+    # backing storage for the lazily looked up building attributes
+    __slots__ = ('url', 'soup', 'ndata', 'idata', 'redux_state', 'zpid', 'lot_id',
+                 'data', 'building', 'building_attributes', 'building_name',
+                 'description', 'low_income', 'senior_housing', 'student_housing',
+                 'office_hours', 'office_number', 'key_features', 'unit_features',
+                 'city', 'county', 'state', 'zip', 'street_address', 'lease_terms',
+                 'utilities_included', 'floorplans', 'management', 'schools',
+                 'nearby_cities', 'nearby_neighborhoods', 'nearby_zip',
+                 'nearby_rental_buildings', 'nearby_amenities', 'review_info',
+                 '__dict__')
+
+    # the only elements of the page that are used, everything else is dropped
+    # while parsing rather than built into the soup
+    _PAGE_STRAINER = SoupStrainer(
+        id=["__NEXT_DATA__", "bdp-building-facts-and-features"])
+
+    # reads the building address fields in a single call
+    _GET_ADDRESS = itemgetter(
+        'city', 'county', 'state', 'zipcode', 'fullAddress')
+
+    # building attribute keys that are exposed as is as the Rental_Apartment
+    # attribute of the same name, looked up on first access by __getattr__
+    _BUILDING_ATTRIBUTE_KEYS = {
+        'application_fee': 'applicationFee',
+        'administrative_fee': 'administrativeFee',
+        'deposit_fee_min': 'depositFeeMin',
+        'deposit_fee_max': 'depositFeeMax',
+        'parking_policies': 'detailedParkingPolicies',
+        'parking_types': 'parkingTypes',
+        'pet_policies': 'detailedPetPolicy',
+        'shared_laundry': 'hasSharedLaundry',
+        'air_conditioning': 'airConditioning',
+        'appliances': 'appliances',
+        'outdoor_common_areas': 'outdoorCommonAreas',
+        'barbecue': 'hasBarbecue',
+        'heating_source': 'heatingSource',
+        'elevator': 'hasElevator',
+        'community_rooms': 'communityRooms',
+        'sports_courts': 'sportsCourts',
+        'bicycle_storage': 'hasBicycleStorage',
+        'guest_suite': 'hasGuestSuite',
+        'storage': 'hasStorage',
+        'pet_park': 'hasPetPark',
+        'maintenance_24_7': 'hasTwentyFourHourMaintenance',
+        'dry_cleaning_drop_off': 'hasDryCleaningDropOff',
+        'online_rent_payment': 'hasOnlineRentPayment',
+        'online_maintenance_portal': 'hasOnlineMaintenancePortal',
+        'onsite_management': 'hasOnsiteManagement',
+        'package_service': 'hasPackageService',
+        'valet_trash': 'hasValetTrash',
+        'spanish_speaking_staff': 'hasSpanishSpeakingStaff',
+        'security_types': 'securityTypes',
+        'view_types': 'viewType',
+        'hot_tub': 'hasHotTub',
+        'sauna': 'hasSauna',
+        'swimming_pool': 'hasSwimmingPool',
+        'assisted_living': 'hasAssistedLiving',
+        'disabled_access': 'hasDisabledAccess',
+        'floor_covering': 'floorCoverings',
+        'communication_types': 'communicationTypes',
+        'ceiling_fan': 'hasCeilingFan',
+        'fire_place': 'hasFireplace',
+        'patio_balcony': 'hasPatioBalcony',
+        'furnished': 'isFurnished',
+        'custom_ammenites': 'customAmenities',
+    }
+
     def __init__(self, url: str) -> None:
         """This initializes the Rental_Apartment object, which call a GET request on the Zillow detail URL. 
 
         Attributes:
             url (str): The detail URL that this class has parsed
-            soup (BeautifulSoup): The html content of this page parsed to a soup object
+            soup (BeautifulSoup): The html content of this page parsed to a soup object, only containing the __NEXT_DATA__ script and the building facts and features
 
             ndata (Dict): The __NEXT_DATA__ data dictionary scraped from html soup
             idata (Dict): The initial data dictionary component of ndata
@@ -110,7 +177,8 @@ class Rental_Apartment(NextJS_Detail_Page):
         self.url = url
 
         # get soup
-        self.soup = self.make_soup(self.get_page(self.url))
+        self.soup = self.make_soup(
+            self.get_page(self.url), parse_only=self._PAGE_STRAINER)
 
         # get ndata and initial
         self.ndata = self.get_next_data(self.soup)
@@ -142,67 +210,12 @@ class Rental_Apartment(NextJS_Detail_Page):
         self.key_features = self.get_key_features()
         self.unit_features: List[str] = self.building['amenityDetails']['unitFeatures']
 
-        self.city: str = self.building['city']
-        self.county: str = self.building['county']
-        self.state: str = self.building['state']
-        self.zip: str = self.building['zipcode']
-        self.street_address: str = self.building['fullAddress']
-
-        self.application_fee: Number | None = self.building_attributes['applicationFee']
-        self.administrative_fee: Number | None = self.building_attributes['administrativeFee']
-        self.deposit_fee_min: Number | None = self.building_attributes['depositFeeMin']
-        self.deposit_fee_max: Number | None = self.building_attributes['depositFeeMax']
-        self.lease_terms: List[str] = self.building_attributes.get(
-            'leaseTerms', [])
-        self.utilities_included: List[str] = self.building_attributes.get(
-            'utilitiesIncluded', [])
-
-        self.parking_policies: List[Dict[str, Any]
-                                    ] = self.building_attributes['detailedParkingPolicies']
-        self.parking_types: List[str] = self.building_attributes['parkingTypes']
-
-        self.pet_policies: List[Dict[str, Any]
-                                ] = self.building_attributes['detailedPetPolicy']
-
-        self.shared_laundry: bool = self.building_attributes['hasSharedLaundry']
-        self.air_conditioning: str = self.building_attributes['airConditioning']
-        self.appliances: List[str] = self.building_attributes['appliances']
-        self.outdoor_common_areas: List[str] = self.building_attributes['outdoorCommonAreas']
-        self.barbecue: bool = self.building_attributes['hasBarbecue']
-        self.heating_source: str = self.building_attributes['heatingSource']
-        self.elevator: Any | None = self.building_attributes['hasElevator']
-        self.community_rooms: List[str] = self.building_attributes['communityRooms']
-        self.sports_courts: List[str] = self.building_attributes['sportsCourts']
-        self.bicycle_storage: Any | None = self.building_attributes['hasBicycleStorage']
-        self.guest_suite: Any | None = self.building_attributes['hasGuestSuite']
-        self.storage: Any | None = self.building_attributes['hasStorage']
-        self.pet_park: Any | None = self.building_attributes['hasPetPark']
-        self.maintenance_24_7: Any | None = self.building_attributes[
-            'hasTwentyFourHourMaintenance']
-        self.dry_cleaning_drop_off: Any | None = self.building_attributes[
-            'hasDryCleaningDropOff']
-        self.online_rent_payment: Any | None = self.building_attributes['hasOnlineRentPayment']
-        self.online_maintenance_portal: Any | None = self.building_attributes[
-            'hasOnlineMaintenancePortal']
-        self.onsite_management: bool = self.building_attributes['hasOnsiteManagement']
-        self.package_service: Any | None = self.building_attributes['hasPackageService']
-        self.valet_trash: Any | None = self.building_attributes['hasValetTrash']
-        self.spanish_speaking_staff: Any | None = self.building_attributes[
-            'hasSpanishSpeakingStaff']
-        self.security_types: List[str] = self.building_attributes['securityTypes']
-        self.view_types: List[str] = self.building_attributes['viewType']
-        self.hot_tub: Any | None = self.building_attributes['hasHotTub']
-        self.sauna: Any | None = self.building_attributes['hasSauna']
-        self.swimming_pool: bool = self.building_attributes['hasSwimmingPool']
-        self.assisted_living: bool = self.building_attributes['hasAssistedLiving']
-        self.disabled_access: Any | None = self.building_attributes['hasDisabledAccess']
-        self.floor_covering: List[str] = self.building_attributes['floorCoverings']
-        self.communication_types: List[str] = self.building_attributes['communicationTypes']
-        self.ceiling_fan: Any | None = self.building_attributes['hasCeilingFan']
-        self.fire_place: Any | None = self.building_attributes['hasFireplace']
-        self.patio_balcony: bool = self.building_attributes['hasPatioBalcony']
-        self.furnished: Any | None = self.building_attributes['isFurnished']
-        self.custom_ammenites: str = self.building_attributes['customAmenities']
+        self.city, self.county, self.state, self.zip, self.street_address = self._GET_ADDRESS(
+            self.building)
+
+        ba = self.building_attributes
+        self.lease_terms: List[str] = ba.get('leaseTerms', [])
+        self.utilities_included: List[str] = ba.get('utilitiesIncluded', [])
 
         self.floorplans: List[Dict[str, Any]] = self.building['floorPlans']
 
@@ -224,6 +237,25 @@ class Rental_Apartment(NextJS_Detail_Page):
 
         self.review_info: Dict[str, Any] = self.building.get('reviewsInfo', {})
 
+    def __getattr__(self, name: str) -> Any:
+        # only called when normal lookup fails, so each building attribute is
+        # read from building_attributes once and then cached on the instance
+        try:
+            key = self._BUILDING_ATTRIBUTE_KEYS[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'") from None
+
+        try:
+            value = self.building_attributes[key]
+        except KeyError:
+            # the listing's data lacks it, so getattr defaults and hasattr work
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}' ({key} is missing from building_attributes)") from None
+
+        self.__dict__[name] = value
+        return value
+
     @staticmethod
     def get_fresh_graphQL_data(lot_id: str) -> Dict[str, str]:
         """Sends a GRAPHQL query to get the fresh data, as opposed to the initial data which may be stale or incomplete (for instance, lease terms are missing in initial data)
@@ -235,8 +267,6 @@ class Rental_Apartment(NextJS_Detail_Page):
             Dict[str, str]: The data dictionary
         """
 
-        url = "https://www.zillow.com/graphql"
-
         payload = {
             "operationName": "BuildingQuery",
             "variables": {
@@ -246,9 +276,7 @@ class Rental_Apartment(NextJS_Detail_Page):
             "queryId": "efbb40baf8ba7747347be4d8b170edc9"
         }
 
-        return requests.request(
-            "POST", url, json=payload, headers=defaults.GRAPHQL_HEADER
-        ).json().get('data', {})
+        return Rental_Apartment.post_graphql(payload).get('data', {})
 
     def get_key_features(self) -> Dict[str, str]:
         """Gets the key features dictionary from the detail page.
@@ -273,14 +301,11 @@ class Rental_Apartment(NextJS_Detail_Page):
             Dict[str, Any]: The management details JSON
         """
 
-        url = "https://www.zillow.com/graphql"
-
         payload = {
             "operationName": "ListingContactDetailsQuery",
             "variables": {"zpid": zpid},
             "query": r"query ListingContactDetailsQuery($zpid: ID!) {  viewer {    roles {      isLandlordLiaisonMember      isLlpRenter      __typename    }    __typename  }  property(zpid: $zpid) {    zpid    brokerId    isHousingConnector    isIncomeRestricted    rentalListingOwnerReputation {      responseRate      responseTimeMs      contactCount      applicationCount      isLandlordIdVerified      __typename    }    isFeatured    isListedByOwner    rentalListingOwnerContact {      displayName      businessName      phoneNumber      agentBadgeType      photoUrl      reviewsReceivedCount      reviewsUrl      ratingAverage      isBrokerLocalCompliance      __typename    }    postingProductType    postingContact {      brokerName      brokerageName      name      __typename    }    postingUrl    rentalMarketingTreatments    building {      bdpUrl      buildingName      housingConnector {        hcLink {          text          __typename        }        __typename      }      ppcLink {        text        __typename      }      __typename    }    __typename  }}"
         }
 
-        return requests.request(
-            "POST", url, json=payload, headers=defaults.GRAPHQL_HEADER,)\
-            .json().get('data', {}).get('property', {})
+        return Rental_Apartment.post_graphql(payload)\
+            .get('data', {}).get('property', {})
@@ -1,6 +1,8 @@
 # This handles parsing of rental homes data
+import requests
 from typing import Dict, Any, List
 from numbers import Number
+from functools import cached_property
 from .details_page import Preload_Detail_Page
 
 
@@ -11,7 +13,10 @@ class Rental_Home(Preload_Detail_Page):
 
     Attributes:
         url (str): The detail URL that this class has parsed
-        soup (BeautifulSoup): The html content of this page parsed to a soup object
+        page (requests.Response): The detail URL page GET response. When created with lazy=True this is only requested on first access
+        preload_only (bool): If only the start of the page was requested for the api preload
+        soup (BeautifulSoup): The html content of this page parsed to a soup object. This is only parsed on first access
+        tree (lxml.html.HtmlElement): The html content of this page parsed to an lxml tree. This is only parsed on first access
         preload (Dict[Any, Any]): The complete api cache preload
 
         zpid (int): The Zillow property ID
@@ -30,6 +35,8 @@ class Rental_Home(Preload_Detail_Page):
         rental_zestimate (int): Zillow's estimated monthly rental value
         tax_history (List[Dict[str, Number]]): The tax history of the property
         price_history (List[Dict[str, Any]]): The price history of the property
+        tax_history_df (pd.DataFrame): The tax history as a DataFrame. Requires pandas
+        price_history_df (pd.DataFrame): The price history as a DataFrame. Requires pandas
         currency (str): The currency the price, zestimate, etc. are in
 
         status (str): The status of the listing. For example - for sale.
@@ -53,6 +60,8 @@ class Rental_Home(Preload_Detail_Page):
 
         interior_sqft (Number): The SQFT area of the interior of the property
 
+        reso_facts (Dict[str, Any]): The RESO facts dictionary of the property, which most of the following attributes are taken from
+
         appliances (List[str]): The list of appliances that are included with the property
         cooling (List[str]): The list of cooling related features 
         heating (List[str]): The list of heating related features
@@ -83,17 +92,25 @@ class Rental_Home(Preload_Detail_Page):
         similar (List[Dict[str, Any]]): Similar properties
         nearby (List[Dict[str, Any]]): Nearby properties
 
+        at_a_glance (Dict[str, Any]): The Zillow at a glance facts, see get_at_a_glance
+        facts_and_features (Dict[str, Any]): The facts and features section of the page, see get_facts_and_features
+        walk_and_bike_score (Dict[str, Any]): The walk and bike score response, see get_walk_and_bike_score. This is only requested on first access
+
         fees_and_dues (List[Dict[str, Any]]): Fees/dues associated with property
     """
 
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, page: requests.Response = None, preload_only: bool = False, lazy: bool = False) -> None:
         """This initializes the Rental_Home object, which call a GET request on the Zillow detail URL. 
 
         Args:
             url (str): The Zillow Rental Property details URL.
+            page (requests.Response, optional): The already fetched GET response of the detail URL, if given no GET request is made. Defaults to None.
+            preload_only (bool, optional): If only the api preload is needed, in which case only the start of the page is requested. The html based attributes (soup, tree, facts_and_features, likely_to_sell) may then be incomplete. Defaults to False.
+            lazy (bool, optional): If True, no request is made until an attribute that needs the page is first accessed. Defaults to False.
         """
 
-        super().__init__(url)
+        super().__init__(url, page, preload_only, lazy)
 
-        self.fees_and_dues: List[Dict[str, Any]
-                                 ] = self.property['resoFacts']['feesAndDues']
+    @cached_property
+    def fees_and_dues(self) -> List[Dict[str, Any]]:
+        return self.reso_facts['feesAndDues']
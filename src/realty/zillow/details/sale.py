@@ -1,8 +1,23 @@
 # This handles parsing of sale data
-from typing import Dict, Any, List
+import numpy as np
+import requests
+from typing import Dict, Any, List, Tuple
 from numbers import Number
+from functools import cached_property
+from lxml.cssselect import CSSSelector
 from .details_page import Preload_Detail_Page
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is an optional speedup, fall back to plain python
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# the likely to sell text is padded with hair spaces (u200a)
+_STRIP_HAIR_SPACE = str.maketrans('', '', '\u200a')
+
 
 class Sale(Preload_Detail_Page):
     """This class extracts the properties/details of a property Sale from Zillow's detail URL page. 
@@ -11,7 +26,10 @@ class Sale(Preload_Detail_Page):
 
     Attributes:
         url (str): The detail URL that this class has parsed
-        soup (BeautifulSoup): The html content of this page parsed to a soup object
+        page (requests.Response): The detail URL page GET response. When created with lazy=True this is only requested on first access
+        preload_only (bool): If only the start of the page was requested for the api preload
+        soup (BeautifulSoup): The html content of this page parsed to a soup object. This is only parsed on first access
+        tree (lxml.html.HtmlElement): The html content of this page parsed to an lxml tree. This is only parsed on first access
         preload (Dict[Any, Any]): The complete api cache preload
 
         zpid (int): The Zillow property ID
@@ -25,12 +43,15 @@ class Sale(Preload_Detail_Page):
         home_type (str): The home type
         year_built (int): Year home was built
         parcel_number (str): The parcel number
+        likely_to_sell (str | None): Zillow likely to sell estimation, None if there is none
 
         price (int): The home price
         zestimate (int): Zillow's estimated home value
         rental_zestimate (int): Zillow's estimated monthly rental value
         tax_history (List[Dict[str, Number]]): The tax history of the property
         price_history (List[Dict[str, Any]]): The price history of the property
+        tax_history_df (pd.DataFrame): The tax history as a DataFrame. Requires pandas
+        price_history_df (pd.DataFrame): The price history as a DataFrame. Requires pandas
         currency (str): The currency the price, zestimate, etc. are in
 
         status (str): The status of the listing. For example - for sale.
@@ -54,6 +75,8 @@ class Sale(Preload_Detail_Page):
 
         interior_sqft (Number): The SQFT area of the interior of the property
 
+        reso_facts (Dict[str, Any]): The RESO facts dictionary of the property, which most of the following attributes are taken from
+
         appliances (List[str]): The list of appliances that are included with the property
         cooling (List[str]): The list of cooling related features 
         heating (List[str]): The list of heating related features
@@ -83,17 +106,36 @@ class Sale(Preload_Detail_Page):
         schools (List[Dict[str, Any]]): The nearby schools
         similar (List[Dict[str, Any]]): Similar properties
         nearby (List[Dict[str, Any]]): Nearby properties
+
+        at_a_glance (Dict[str, Any]): The Zillow at a glance facts, see get_at_a_glance
+        facts_and_features (Dict[str, Any]): The facts and features section of the page, see get_facts_and_features
+        walk_and_bike_score (Dict[str, Any]): The walk and bike score response, see get_walk_and_bike_score. This is only requested on first access
     """
 
-    def __init__(self, url: str) -> None:
+    _SELECTORS = {
+        **Preload_Detail_Page._SELECTORS,
+        'likely_to_sell': CSSSelector("p.kHeRng"),
+    }
+
+    def __init__(self, url: str, page: requests.Response = None, preload_only: bool = False, lazy: bool = False) -> None:
         """This initializes the sale object, which call a GET request on the Zillow detail URL. 
 
         Args:
             url (str): The Zillow Property Sale details URL.
+            page (requests.Response, optional): The already fetched GET response of the detail URL, if given no GET request is made. Defaults to None.
+            preload_only (bool, optional): If only the api preload is needed, in which case only the start of the page is requested. The html based attributes (soup, tree, facts_and_features, likely_to_sell) may then be incomplete. Defaults to False.
+            lazy (bool, optional): If True, no request is made until an attribute that needs the page is first accessed. Defaults to False.
         """
 
-        super().__init__(url)
-        self.parcel_number: str = self.property['resoFacts']['parcelNumber']
+        super().__init__(url, page, preload_only, lazy)
+
+    @cached_property
+    def parcel_number(self) -> str:
+        return self.reso_facts['parcelNumber']
+
+    @cached_property
+    def likely_to_sell(self) -> str | None:
+        return self.get_likely_to_sell()
 
     def get_likely_to_sell(self) -> str | None:
         """Gets the Zillow likely to sell estimation.
@@ -101,12 +143,12 @@ class Sale(Preload_Detail_Page):
         Returns:
             str | None: Zillow likely to sell estimation. Returns None if there is none
         """
-        tag = self.soup.find("p", "kHeRng")
+        tags = self._SELECTORS['likely_to_sell'](self.tree)
 
-        if not tag:
-            return tag
+        if not tags:
+            return None
         else:
-            return tag.text.replace(u'\u200a', '')
+            return tags[0].text_content().translate(_STRIP_HAIR_SPACE)
 
     @staticmethod
     def calculate_monthly_mortgage(principal: Number, interest: Number, months: Number) -> Number:
@@ -114,13 +156,44 @@ class Sale(Preload_Detail_Page):
 
         Args:
             principal (Number): The principal for the mortgage (in this case home price minus the down payment)
-            interest (Number): The interest rate as a monthly percentage (5% -> (5/100)/12)
+            interest (Number): The interest rate as a monthly percentage (5% -> (5/100)/12). An interest rate of 0 is handled as principal / months
             months (Number): Number of months on the mortagage
 
         Returns:
             Number: The monthly mortgage payment
         """
-        return principal * (interest * (1+interest)**months) / ((1+interest)**months-1)
+        if not interest:  # formula is 0/0 without interest
+            return principal / months
+
+        growth = (1 + interest)**months
+        return principal * interest * growth / (growth - 1)
+
+    @staticmethod
+    def calculate_monthly_mortgage_vec(principal: Number | np.ndarray, interest: Number | np.ndarray, months: Number | np.ndarray) -> np.ndarray:
+        """Vectorized version of calculate_monthly_mortgage for calculating the monthly mortgage payment over many scenarios at once. Arguments are broadcast against each other following numpy broadcasting rules.
+
+        Args:
+            principal (Number | np.ndarray): The principal(s) for the mortgage (in this case home price minus the down payment)
+            interest (Number | np.ndarray): The interest rate(s) as a monthly percentage (5% -> (5/100)/12). An interest rate of 0 is handled as principal / months
+            months (Number | np.ndarray): Number of months on the mortagage
+
+        Returns:
+            np.ndarray: The monthly mortgage payments
+        """
+        principal, interest, months = np.broadcast_arrays(
+            np.asarray(principal, dtype=np.float64),
+            np.asarray(interest, dtype=np.float64),
+            np.asarray(months, dtype=np.float64),
+        )
+
+        growth = np.power(1.0 + interest, months)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(
+                interest == 0,
+                principal / months,
+                principal * interest * growth / (growth - 1.0)
+            )
 
     def get_monthly_estimated_cost(self, down: Number, interest: Number = None, months: Number = 30*12, tax: Number = None, home_insurance: Number = None, mortgage_insurance: Number = 0, hoa_fee: Number = None, utilies: Number = 0) -> Number:
         """Estimates the monthly cost of buying the property. 
@@ -141,40 +214,131 @@ class Sale(Preload_Detail_Page):
         Returns:
             Number: The estimated monthly cost
         """
-        if not interest:
-            interest = self.property['mortgageRates']['thirtyYearFixedRate']
+        interest, tax, home_insurance, hoa_fee = self._resolve_monthly_cost_defaults(
+            interest, tax, home_insurance, hoa_fee)
+
+        return _monthly_cost_kernel(
+            self.price, down, interest, months, tax,
+            home_insurance, mortgage_insurance, hoa_fee, utilies
+        )
+
+    def get_monthly_estimated_costs(self, downs: np.ndarray, interests: np.ndarray = None, months: Number = 30*12, tax: Number = None, home_insurance: Number = None, mortgage_insurance: Number = 0, hoa_fee: Number = None, utilies: Number = 0) -> np.ndarray:
+        """Estimates the monthly cost of buying the property for many down payment and interest rate scenarios at once. See get_monthly_estimated_cost for the details of the estimate.
+
+        Args:
+            downs (np.ndarray): The money down for each scenario.
+            interests (np.ndarray, optional): The interest rate for each scenario, given as decimals. Must be the same length as downs. If not specified (None) will use Zillow's estimated 30 year fixed rate for every scenario. Defaults to None.
+            months (Number, optional): The number of months on the mortgage. Defaults to 30.
+            tax (Number, optional): The property tax rate, given as a decimal. If not specified (None) will use property's current tax rate. Defaults to None.
+            home_insurance (Number, optional): Home insurance monthly cost. If not specified (None) will estimate as 0.0042 * property price. Defaults to None.
+            mortgage_insurance (Number, optional): The mortgage monthly insurance cost. Defaults to 0.
+            hoa_fee (Number, optional): The monthly HOA fee. If not specified (None) will lookup the property HOA fee, if any. Defaults to None.
+            utilies (Number, optional): The monthly cost of utilities. Defaults to 0.
+
+        Returns:
+            np.ndarray: The estimated monthly cost of each scenario
+        """
+        downs = np.asarray(downs, dtype=np.float64)
+
+        interest, tax, home_insurance, hoa_fee = self._resolve_monthly_cost_defaults(
+            None, tax, home_insurance, hoa_fee)
+
+        if interests is None:
+            interests = np.full(downs.shape, interest)
+        else:
+            interests = np.asarray(interests, dtype=np.float64)
+
+        return _monthly_cost_batch_kernel(
+            float(self.price), downs, interests, float(months), float(tax),
+            float(home_insurance), float(mortgage_insurance), float(hoa_fee), float(utilies)
+        )
+
+    def monthly_cost_grid(self, down_grid: np.ndarray, rate_grid: np.ndarray, months: Number = 30*12, tax: Number = None, home_insurance: Number = None, mortgage_insurance: Number = 0, hoa_fee: Number = None, utilies: Number = 0) -> np.ndarray:
+        """Estimates the monthly cost of buying the property over every combination of down payment and interest rate, for example for sensitivity plots. See get_monthly_estimated_cost for the details of the estimate.
+
+        Args:
+            down_grid (np.ndarray): The money down values to evaluate.
+            rate_grid (np.ndarray): The interest rates to evaluate, given as decimals.
+            months (Number, optional): The number of months on the mortgage. Defaults to 30.
+            tax (Number, optional): The property tax rate, given as a decimal. If not specified (None) will use property's current tax rate. Defaults to None.
+            home_insurance (Number, optional): Home insurance monthly cost. If not specified (None) will estimate as 0.0042 * property price. Defaults to None.
+            mortgage_insurance (Number, optional): The mortgage monthly insurance cost. Defaults to 0.
+            hoa_fee (Number, optional): The monthly HOA fee. If not specified (None) will lookup the property HOA fee, if any. Defaults to None.
+            utilies (Number, optional): The monthly cost of utilities. Defaults to 0.
+
+        Returns:
+            np.ndarray: 2D array of the estimated monthly costs, of shape (len(down_grid), len(rate_grid))
+        """
+        downs, rates = np.meshgrid(
+            np.asarray(down_grid, dtype=np.float64),
+            np.asarray(rate_grid, dtype=np.float64),
+            indexing='ij'
+        )
+
+        return self.get_monthly_estimated_costs(
+            downs.ravel(), rates.ravel(), months=months, tax=tax, home_insurance=home_insurance,
+            mortgage_insurance=mortgage_insurance, hoa_fee=hoa_fee, utilies=utilies
+        ).reshape(downs.shape)
+
+    def _resolve_monthly_cost_defaults(self, interest: Number, tax: Number, home_insurance: Number, hoa_fee: Number) -> Tuple[Number, Number, Number, Number]:
+        """Fills in the unspecified monthly cost parameters with the property's values or Zillow's estimates.
+
+        Args:
+            interest (Number): The interest rate or None
+            tax (Number): The property tax rate or None
+            home_insurance (Number): The home insurance monthly cost or None
+            hoa_fee (Number): The monthly HOA fee or None
+
+        Returns:
+            Tuple[Number, Number, Number, Number]: interest, tax, home_insurance, hoa_fee
+        """
+        # Zillow sometimes omits these keys, missing values are treated as unknown
+        p = self.property
+        price = self.price
+
+        if interest is None:
+            interest = (p.get('mortgageRates') or {}).get('thirtyYearFixedRate')
             if interest:  # check if had actual value
                 interest /= 100  # zillow gives as a percentage so need to divide by 100
             else:
                 interest = 0.06  # just some value to fall back on
 
-        mortgage_monthly = self.calculate_monthly_mortgage(
-            self.price - down, interest/12, months
-        )
-        if tax:
-            pass
-        elif not self.property['propertyTaxRate']:
-            tax = 0
-        else:
-            tax = self.property['propertyTaxRate'] / 100
+        if tax is None:
+            tax_rate = p.get('propertyTaxRate')
+            tax = tax_rate / 100 if tax_rate else 0
 
-        tax_monthly = tax * self.price / 12
+        if home_insurance is None:
+            home_insurance = price * 0.0042
 
-        if not home_insurance:
-            home_insurance = self.price * 0.0042
+        if hoa_fee is None:
+            hoa_fee = p.get('monthlyHoaFee') or 0
 
-        if hoa_fee:
-            pass
-        elif not self.property['monthlyHoaFee']:
-            hoa_fee = 0
-        else:
-            hoa_fee = self.property['monthlyHoaFee']
-
-        return sum([
-            mortgage_monthly,
-            mortgage_insurance,
-            tax_monthly,
-            home_insurance,
-            hoa_fee,
-            utilies
-        ])
+        return interest, tax, home_insurance, hoa_fee
+
+
+# The monthly cost formula is split out into free functions so that it can be
+# compiled by numba (when installed) for scenario sweeps.
+
+@njit('float64(float64, float64, float64, float64, float64, float64, float64, float64, float64)', cache=True, fastmath=True)
+def _monthly_cost_kernel(price, down, interest, months, tax, home_insurance, mortgage_insurance, hoa_fee, utilities):
+    monthly_interest = interest / 12
+    if monthly_interest == 0:
+        mortgage_monthly = (price - down) / months
+    else:
+        growth = (1 + monthly_interest)**months
+        mortgage_monthly = (price - down) * \
+            monthly_interest * growth / (growth - 1)
+
+    return mortgage_monthly + mortgage_insurance + tax * price / 12 + home_insurance + hoa_fee + utilities
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _monthly_cost_batch_kernel(price, downs, interests, months, tax, home_insurance, mortgage_insurance, hoa_fee, utilities):
+    costs = np.empty(downs.shape[0])
+    for i in prange(downs.shape[0]):
+        costs[i] = _monthly_cost_kernel(
+            price, downs[i], interests[i], months, tax,
+            home_insurance, mortgage_insurance, hoa_fee, utilities
+        )
+
+    return costs
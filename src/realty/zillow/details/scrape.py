@@ -1,7 +1,9 @@
 # this file is responsible for parsing the detailUrl page found in the query results.
 from typing import Literal, List, Dict, Any
-import numpy as np
-from time import sleep
+import random
+import threading
+from time import sleep, monotonic
+from concurrent.futures import ThreadPoolExecutor
 from numbers import Number
 from . import Sale, Rental_Home, Rental_Apartment
 
@@ -37,53 +39,110 @@ def scrape_listing(detail_url: str, status_type: Literal["FOR_RENT", "FOR_SALE"]
         f"status_type should be either FOR_RENT or FOR_SALE, was {status_type}")
 
 
-def scrape_listings(query_results: List[Dict[str, Any]], delay: Number = 0, jitter: Number = 1, verbose=False) -> List[Sale] | List[Rental_Home] | List[Rental_Apartment]:
-    """Scrapes a list of Zillow Detail URLs
+def scrape_listings(query_results: List[Dict[str, Any]], delay: Number = 0, jitter: Number = 1, verbose=False, max_workers: int = 1, rng: random.Random | None = None) -> List[Sale] | List[Rental_Home] | List[Rental_Apartment]:
+    """Scrapes a list of Zillow Detail URLs. By default the listings are scraped one after another, with max_workers above 1 they are scraped concurrently by a pool of worker threads, all sharing the pooled Zillow session.
 
     Args:
         query_results (List[Dict[str, Any]]): Results of the Query, see Query class
-        delay (Number, optional): The static delay amount. This is to help prevent Zillow from blocking scraping due to high number of requests in rapid succession. Defaults to 0.
+        delay (Number, optional): The static delay amount. Each worker waits a random time of up to delay * jitter seconds between the starts of its requests, so the wait overlaps with the previous request. This is to help prevent Zillow from blocking scraping due to high number of requests in rapid succession. Defaults to 0.
         jitter (Number, optional): The jitter factor for the delay time. Defaults to 1.
         verbose (bool, optional): If function should be verbose, printing out the progress of parsing the listings. Defaults to False.
+        max_workers (int, optional): The maximum number of listings scraped at the same time. NOTE: the delay applies per worker, so with more workers Zillow sees proportionally more requests in the same time, which makes blocking more likely. Defaults to 1.
+        rng (random.Random | None, optional): The random number generator for the delay times, for example random.Random(seed) for reproducible delays. Defaults to None (the global random generator).
 
     Returns:
-        List[Sale] | List[Rental_Home] | List[Rental_Apartment]: List of scraped listing, which typically will be of one type, Sale, Rental_home, or Rental_Apartment, that being said if multiple types are mixed in query_results, the resulting list will be of multiple types.
+        List[Sale] | List[Rental_Home] | List[Rental_Apartment]: List of scraped listing, in the same order as query_results, which typically will be of one type, Sale, Rental_home, or Rental_Apartment, that being said if multiple types are mixed in query_results, the resulting list will be of multiple types.
     """
 
-    delay_array = delay * np.random.rand(len(query_results)) * jitter
-    # last delay should be zero since no more details to scrape
-    delay_array[-1] = 0
+    total = len(query_results)
 
-    results = []
-    for dtime, (i, result) in zip(delay_array, enumerate(query_results, 1)):
+    # drawn up front so each listing gets the same delay regardless of the
+    # order the workers run in
+    uniform = (rng or random).uniform
+    delays = [uniform(0, delay * jitter) for _ in range(total)]
 
-        results.append(
-            scrape_listing(result["detailUrl"], result['statusType'])
-        )
+    worker = threading.local()
+
+    def scrape(i: int, result: Dict[str, Any], dtime: float) -> Sale | Rental_Home | Rental_Apartment:
+        # the delay is counted from the start of the worker's previous request
+        # so that it overlaps with that request rather than adding to it, the
+        # worker's first request is not delayed
+        previous_start = getattr(worker, 'previous_start', None)
+        if previous_start is None:
+            dtime = 0
+        else:
+            dtime = max(0, previous_start + dtime - monotonic())
 
         if verbose:
-            print(f"Parsed {i} of {len(query_results)}, delaying for {dtime}s")
+            print(f"Scraping {i} of {total}, delaying for {dtime}s")
 
         sleep(dtime)
+        worker.previous_start = monotonic()
+        listing = scrape_listing(result["detailUrl"], result['statusType'])
+
+        if verbose:
+            print(f"Parsed {i} of {total}")
 
-    return results
+        return listing
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(scrape, range(1, total + 1), query_results, delays))
 
 
 class Lazy_Listings(list):
     """Lazy Listings is a list child class that takes a list of Query results and will return the scraped listing details based on the index or slice.
+
+    Slicing returns another Lazy_Listings, so no listing is scraped until it is indexed or iterated. Scraped listings are cached (by detail URL) and the cache is shared with any slices, so each listing is only scraped once. Use prefetch to scrape the listings concurrently ahead of time.
     """
 
+    def __init__(self, query_results: List[Dict[str, Any]] = (), _cache: Dict[str, Sale | Rental_Home | Rental_Apartment] | None = None):
+        super().__init__(query_results)
+        self._cache = {} if _cache is None else _cache
+
+    def _scrape(self, result: Dict[str, Any]) -> Sale | Rental_Home | Rental_Apartment:
+        listing = self._cache.get(result["detailUrl"])
+
+        if listing is None:
+            listing = scrape_listing(result["detailUrl"], result['statusType'])
+            self._cache[result["detailUrl"]] = listing
+
+        return listing
+
     def __getitem__(self, n):
         result = super().__getitem__(n)
 
         if isinstance(result, list):
-            return [scrape_listing(r["detailUrl"], r['statusType']) for r in result]
+            return Lazy_Listings(result, _cache=self._cache)
         else:
-            return scrape_listing(result["detailUrl"], result['statusType'])
+            return self._scrape(result)
 
     def __iter__(self):
         for result in super().__iter__():
-            yield scrape_listing(result["detailUrl"], result['statusType'])
+            yield self._scrape(result)
+
+    def prefetch(self, max_workers: int = 8, delay: Number = 0, jitter: Number = 1, verbose=False) -> 'Lazy_Listings':
+        """Concurrently scrapes all listings which have not been scraped yet, see scrape_listings. Subsequent indexing/iteration will use the scraped listings.
+
+        Args:
+            max_workers (int, optional): The maximum number of listings scraped at the same time. Defaults to 8.
+            delay (Number, optional): The static delay amount, see scrape_listings. Defaults to 0.
+            jitter (Number, optional): The jitter factor for the delay time. Defaults to 1.
+            verbose (bool, optional): If function should be verbose. Defaults to False.
+
+        Returns:
+            Lazy_Listings: self
+        """
+
+        # only the first occurrence of each detail url needs to be scraped
+        pending = list({
+            r["detailUrl"]: r for r in super().__iter__() if r["detailUrl"] not in self._cache
+        }.values())
+
+        listings = scrape_listings(
+            pending, delay=delay, jitter=jitter, verbose=verbose, max_workers=max_workers)
+        self._cache.update(zip((r["detailUrl"] for r in pending), listings))
+
+        return self
 
 
 def lazy_scrape_listings(query_results: List[Dict[str, Any]]) -> Lazy_Listings:
@@ -1,27 +1,151 @@
-import json
+import asyncio
 import requests
-from typing import Dict, Any, List, Literal, Union, Set
+from functools import wraps
+from urllib.parse import quote_plus
+from typing import Dict, Any, Iterable, List, Literal, Union, Set
 from . import defaults
+from .session import SESSION
+
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup, fall back to the stdlib
+    import json
+    from json import loads as json_loads
+
+    def json_dumps(obj: Any) -> str:
+        # compact and unescaped, the same output as orjson
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+try:
+    import httpx
+except ImportError:  # httpx is optional, only needed for the batched async requests
+    httpx = None
+
+_SALE_OPTIONS = frozenset({
+    "ForSaleByAgent", "ForSaleByOwner", "NewConstruction", "ComingSoon",
+    "Auction", "ForSaleForeclosure"
+})
+# The sale options that are included unless excluded by set_filter_preset
+
+_HOME_TYPES = frozenset({
+    "SingleFamily", "Townhouse", "MultiFamily", "Condo", "LotLand",
+    "Apartment", "Manufactured", "ApartmentOrCondo"
+})
+# The home types that are included unless excluded by set_filter_preset
+
+_IS_KEYS = {opt: f"is{opt}" for opt in _SALE_OPTIONS | _HOME_TYPES}
+# The filter state key of each sale option and home type
+
+_FEATURE_KEYS = {
+    "Garage": "hasGarage",
+    "BasementFinished": "isBasementFinished",
+    "BasementUnfinished": "isBasementUnfinished",
+    "SingleStory": "singleStory",
+    "AgeRestricted55Plus": "ageRestricted55Plus",
+    "AirConditioning": "hasAirConditioning",
+    "Pool": "hasPool",
+    "Waterfront": "isWaterfront",
+    "CityView": "isCityView",
+    "ParkView": "isParkView",
+    "MountainView": "isMountainView",
+    "WaterView": "isWaterView",
+}
+# The filter state keys of the set_filter_preset features
+
+_VALUE_TRUE = {"value": True}
+_VALUE_FALSE = {"value": False}
+# Filter state values shared by every set_filter_preset filter state, these
+# must not be mutated (set a new dict for the filter state key instead)
+
+_MULTIPART_BOUNDARY = "---011000010111000001101001"
+_MULTIPART_PREFIX = f'--{_MULTIPART_BOUNDARY}\r\nContent-Disposition: form-data; name="clipPolygon"\r\n\r\n'.encode()
+_MULTIPART_SUFFIX = f'\r\n--{_MULTIPART_BOUNDARY}--\r\n'.encode()
+_MULTIPART_CONTENT_TYPE = {
+    "content-type": f"multipart/form-data; boundary={_MULTIPART_BOUNDARY}"}
+# The set_custom_region form body is built from these, only the region varies
+
+
+def _min_max(min_value: Union[None, int], max_value: Union[None, int]) -> Dict[str, int]:
+    # filter state range, only containing the bounds that are set
+    return {k: v for k, v in (("min", min_value), ("max", max_value)) if v is not None}
+
+
+def _with_query_string(url: str, query_string: str) -> str:
+    # appends the query string to the URL, after any query string the URL
+    # already has (as requests does for params)
+    if "?" not in url:
+        return f"{url}?{query_string}"
+    if url.endswith(("?", "&")):
+        return f"{url}{query_string}"
+    return f"{url}&{query_string}"
+
+
+def _changes_sub_parms(method):
+    # for the set_*/clear_* methods that change sub_parms, clears the cached
+    # encoding of sub_parms (see get_params_string) and returns self
+    @wraps(method)
+    def wrapper(self: 'Query', *args, **kwargs) -> 'Query':
+        method(self, *args, **kwargs)
+        self._sub_parms_json = None
+        return self
+
+    return wrapper
 
 
 class Query:
+    """This class builds and sends the Zillow search query. The parameters are set with the chainable set_*/clear_* methods, then the results are requested with get_response.
+
+    The JSON encoding of the parameters is cached between requests (see get_params_string), and only reset by the set_*/clear_* methods and by assigning wants. Changes made to the sub_parms or wants dicts in place are therefore not sent once the parameters have been generated. Replace wants instead of mutating it, and change sub_parms through the methods.
+
+    Attributes:
+        sub_parms (Dict[str, Any]): The search query state. Change it with the set_*/clear_* methods, not in place
+        wants (Dict[str, Any]): The result categories requested. Assign a new dict rather than mutating it, assigning resets the cached encoding
+    """
+
+    __slots__ = ('sub_parms', '_sub_parms_json', '_wants', '_wants_json')
+
+    # TODO further experiment to reduce unnecessary params
+    _DEFAULT_SUB_PARMS = {
+        "isMapVisible": "true",
+        "isListVisible": "true",
+    }
+
+    _DEFAULT_WANTS = {
+        "cat1": ("listResults", "mapResults"),
+        "cat2": ("total",)
+    }
 
     def __init__(self):
         """Initializes defaults. Note that defaults are based on assumptions of how the Zillow API works, and are not necessarily optimal. 
         """
 
-        # TODO further experiment to reduce unnecessary params
-
+        # copies of the class defaults, nested values included, so that no
+        # two queries share mutable state
         self.sub_parms = {
             "pagination": {"currentPage": 1},
-            "isMapVisible": "true",
-            "isListVisible": "true",
+            **Query._DEFAULT_SUB_PARMS,
         }
+        self._sub_parms_json = None
 
-        self.wants = {
-            "cat1": ["listResults", "mapResults"],
-            "cat2": ["total"]
-        }
+        self.wants = {k: list(v) for k, v in Query._DEFAULT_WANTS.items()}
+
+    @property
+    def wants(self) -> Dict[str, Any]:
+        """The result categories requested. NOTE: the encoding is cached, so assign a new dict rather than changing this one in place, in place changes are not sent once the parameters have been generated.
+        """
+        return self._wants
+
+    @wants.setter
+    def wants(self, wants: Dict[str, Any]) -> None:
+        # the encoded wants are cached since they rarely change between
+        # requests (e.g. when paginating), replacing wants resets the cache.
+        self._wants = wants
+        self._wants_json = None
 
     def set_page(self, current_page: int) -> 'Query':
         """Sets current page of paginated search results
@@ -35,6 +159,7 @@ class Query:
         self.sub_parms["pagination"] = {"currentPage": current_page}
         return self
 
+    @_changes_sub_parms
     def set_search_term(self, term: str) -> 'Query':
         """Sets the query search term.
 
@@ -46,7 +171,6 @@ class Query:
         """
 
         self.sub_parms["usersSearchTerm"] = term
-        return self
 
     def set_map_bounds(self, west: float, east: float, south: float, north: float) -> 'Query':
         """Sets the map bounds for the query
@@ -60,14 +184,15 @@ class Query:
         Returns:
             Query: Returns self
         """
-        self.sub_parms["mapBounds"] = {
-            "west": -85.58309022900734,
-            "east": -85.18483583447609,
-            "south": 34.73748469750508,
-            "north": 35.40678434232889,
-        }
+        bounds = {"west": west, "east": east, "south": south, "north": north}
+
+        # the encoding is kept when the bounds are unchanged
+        if self.sub_parms.get("mapBounds") != bounds:
+            self.sub_parms["mapBounds"] = bounds
+            self._sub_parms_json = None
         return self
 
+    @_changes_sub_parms
     def set_region(self, region_id: int, region_type: int) -> 'Query':
         """Sets the region. Note that the region ID and Type appear to be internal to Zillow, therefore this is a difficult query param to use
 
@@ -80,13 +205,13 @@ class Query:
         """
         self.sub_parms["regionSelection"] = [
             {"regionId": region_id, "regionType": region_type}]
-        return self
 
+    @_changes_sub_parms
     def set_map_visable(self, map_visible: bool) -> 'Query':
         # TODO determine what impact this has
         self.sub_parms["isMapVisible"] = map_visible
-        return self
 
+    @_changes_sub_parms
     def set_filter(self, filter_dict: Dict[str, Any]) -> 'Query':
         """Sets the filter state. This works by expanding the filter_dict from {key: value} to {key: {'value': value}} which is the format that the API accepts.
 
@@ -98,8 +223,8 @@ class Query:
         """
 
         self.sub_parms["filterState"] = filter_dict
-        return self
 
+    @_changes_sub_parms
     def set_filter_preset(
             self,
             for_sale: bool = True,
@@ -112,7 +237,7 @@ class Query:
                 "Auction",
                 "ForSaleForeclosure",
                 "RecentlySold"
-            ]] = {"ForSaleByAgent", "ForSaleByOwner", "NewConstruction", "ComingSoon", "Auction", "ForSaleForeclosure"},
+            ]] | None = None,
             sold_in_last_x_days: Union[None, int] = None,
             price_max: Union[None, int] = None,
             price_min: Union[None, int] = None,
@@ -129,7 +254,7 @@ class Query:
                 "Apartment",
                 "Manufactured",
                 "ApartmentOrCondo",
-            ]] = {"SingleFamily", "Townhouse", "MultiFamily", "Condo", "LotLand", "Apartment", "Manufactured", "ApartmentOrCondo"},
+            ]] | None = None,
             hoa: Union[None, int] = None,
             parking_spots: Union[None, int] = None,
             features: Set[Literal[
@@ -145,21 +270,21 @@ class Query:
                 "ParkView",
                 "MountainView",
                 "WaterView",
-            ]] = set(),
+            ]] | None = None,
             house_sqft_max: Union[None, int] = None,
             house_sqft_min: Union[None, int] = None,
             lot_sqft_max: Union[None, int] = None,
             lot_sqft_min: Union[None, int] = None,
             year_built_start: Union[None, int] = None,
             year_built_end: Union[None, int] = None,
-            keywords: Set[str] = set(),
+            keywords: Set[str] | None = None,
     ) -> 'Query':
-        """This sets the filter_state based on the parameters given. This is used for the same purpose as set_filter but this is easier to use.
+        """This sets the filter_state based on the parameters given. This is used for the same purpose as set_filter but this is easier to use. NOTE: the {"value": True} and {"value": False} dicts in the resulting filter state are shared, to change the filter state replace them rather than mutating them.
 
         Args:
             for_sale (bool, optional): If should search for sales, if set to False will search for rentals. Note that sale_options do not apply to rentals and will be ignored. Defaults to True.
             all_homes (bool, optional): TODO determine the affect of this param. Defaults to True.
-            sale_options (Set[Literal[ &quot;ForSaleByAgent&quot;, &quot;ForSaleByOwner&quot;, &quot;NewConstruction&quot;, &quot;ComingSoon&quot;, &quot;Auction&quot;, &quot;ForSaleForeclosure&quot;, &quot;RecentlySold&quot; ]], optional): Sale options. Defaults to {"ForSaleByAgent", "ForSaleByOwner", "NewConstruction", "ComingSoon", "Auction", "ForSaleForeclosure"}.
+            sale_options (Set[Literal[ &quot;ForSaleByAgent&quot;, &quot;ForSaleByOwner&quot;, &quot;NewConstruction&quot;, &quot;ComingSoon&quot;, &quot;Auction&quot;, &quot;ForSaleForeclosure&quot;, &quot;RecentlySold&quot; ]], optional): Sale options. Defaults to None, which is {"ForSaleByAgent", "ForSaleByOwner", "NewConstruction", "ComingSoon", "Auction", "ForSaleForeclosure"}.
             sold_in_last_x_days (Union[None, int], optional): For looking for already sold houses that have been sold in the last X. Note that this requires 'RecentlySold' in the sale options. This also has no affect if for_sale is False. Defaults to None.
             price_max (Union[None, int], optional): The max price. Defaults to None.
             price_min (Union[None, int], optional): The min price. Defaults to None.
@@ -167,17 +292,17 @@ class Query:
             monthly_payment_min (Union[None, int], optional): The monthly payment min. Defaults to None.
             beds (Union[None, int], optional): The minimum number of beds. Defaults to None.
             baths (Union[None, int], optional): The minimum number of baths. Defaults to None.
-            home_type (Set[Literal[ &quot;SingleFamily&quot;, &quot;Townhouse&quot;, &quot;MultiFamily&quot;, &quot;Condo&quot;, &quot;LotLand&quot;, &quot;Apartment&quot;, &quot;Manufactured&quot;, &quot;ApartmentOrCondo&quot;, ]], optional): _description_. Defaults to {"SingleFamily", "Townhouse", "MultiFamily", "Condo", "LotLand", "Apartment", "Manufactured", "ApartmentOrCondo"}.
+            home_type (Set[Literal[ &quot;SingleFamily&quot;, &quot;Townhouse&quot;, &quot;MultiFamily&quot;, &quot;Condo&quot;, &quot;LotLand&quot;, &quot;Apartment&quot;, &quot;Manufactured&quot;, &quot;ApartmentOrCondo&quot;, ]], optional): _description_. Defaults to None, which is all of the home types.
             hoa (Union[None, int], optional): Types of homes to include. Defaults to None.
             parking_spots (Union[None, int], optional): Minimum number of parking spots. Defaults to None.
-            features (Set[Literal[ &quot;Garage&quot;, &quot;BasementFinished&quot;, &quot;BasementUnfinished&quot;, &quot;SingleStory&quot;, &quot;AgeRestricted55Plus&quot;, &quot;AirConditioning&quot;, &quot;Pool&quot;, &quot;Waterfront&quot;, &quot;CityView&quot;, &quot;ParkView&quot;, &quot;MountainView&quot;, &quot;WaterView&quot;, ]], optional): Required features for houses to have in results. Defaults to set().
+            features (Set[Literal[ &quot;Garage&quot;, &quot;BasementFinished&quot;, &quot;BasementUnfinished&quot;, &quot;SingleStory&quot;, &quot;AgeRestricted55Plus&quot;, &quot;AirConditioning&quot;, &quot;Pool&quot;, &quot;Waterfront&quot;, &quot;CityView&quot;, &quot;ParkView&quot;, &quot;MountainView&quot;, &quot;WaterView&quot;, ]], optional): Required features for houses to have in results. Defaults to None (no required features).
             house_sqft_max (Union[None, int], optional): House sqft max. Defaults to None.
             house_sqft_min (Union[None, int], optional): House sqft min. Defaults to None.
             lot_sqft_max (Union[None, int], optional): Lot sqft max. Defaults to None.
             lot_sqft_min (Union[None, int], optional): Lot sqft min. Defaults to None.
             year_built_start (Union[None, int], optional): Year built min. Defaults to None.
             year_built_end (Union[None, int], optional): Year built max. Defaults to None.
-            keywords (Set[str], optional): Search keywords. Defaults to set().
+            keywords (Set[str], optional): Search keywords. Defaults to None (no keywords).
 
         Returns:
             'Query': Returns self
@@ -187,158 +312,104 @@ class Query:
 
         filter_state = {"isAllHomes": {"value": all_homes}}
 
-        if for_sale:
+        if for_sale and sale_options is not None:
 
-            possible_sale_options = {"ForSaleByAgent", "ForSaleByOwner", "NewConstruction",
-                                     "ComingSoon", "Auction", "ForSaleForeclosure"}
-
-            diff = possible_sale_options - set(sale_options)
-            for opt in diff:
-                filter_state[f"is{opt}"] = {"value": False}
+            # difference takes any iterable, so lists do not need converting
+            diff = _SALE_OPTIONS.difference(sale_options)
+            filter_state.update(dict.fromkeys(
+                (_IS_KEYS[opt] for opt in diff), _VALUE_FALSE))
 
             if "RecentlySold" in sale_options:
-                filter_state["isRecentlySold"] = {"value": True}
+                filter_state["isRecentlySold"] = _VALUE_TRUE
 
-                if sold_in_last_x_days:
+                if sold_in_last_x_days is not None:
                     filter_state["doz"] = {"value": str(sold_in_last_x_days)}
 
-        else:
-            filter_state["isForRent"] = {"value": True}
-            filter_state["isForSaleByAgent"] = {"value": False}
-            filter_state["isForSaleByOwner"] = {"value": False}
-            filter_state["isNewConstruction"] = {"value": False}
-            filter_state["isComingSoon"] = {"value": False}
-            filter_state["isAuction"] = {"value": False}
-            filter_state["isForSaleForeclosure"] = {"value": False}
-
-        if price_max or price_min:
-            price = {}
-            if price_max:
-                price["max"] = price_max
-            if price_min:
-                price["min"] = price_min
+        elif not for_sale:
+            filter_state["isForRent"] = _VALUE_TRUE
+            filter_state.update(dict.fromkeys(
+                (_IS_KEYS[opt] for opt in _SALE_OPTIONS), _VALUE_FALSE))
 
+        if price := _min_max(price_min, price_max):
             filter_state["price"] = price
 
-        if monthly_payment_max or monthly_payment_min:
-            monthly = {}
-            if monthly_payment_max:
-                monthly["max"] = monthly_payment_max
-            if monthly_payment_min:
-                monthly["min"] = monthly_payment_min
-
+        if monthly := _min_max(monthly_payment_min, monthly_payment_max):
             filter_state["monthlyPayment"] = monthly
 
-        if beds:
+        if beds is not None:
             filter_state["beds"] = {"min": beds}
 
-        if baths:
+        if baths is not None:
             filter_state["baths"] = {"min": baths}
 
         if home_type:
-            possible_home_types = {"SingleFamily", "Townhouse", "MultiFamily",
-                                   "Condo", "LotLand", "Apartment", "Manufactured", "ApartmentOrCondo"}
-
-            diff = possible_home_types - set(home_type)
-            for opt in diff:
-                filter_state[f"is{opt}"] = {"value": False}
+            diff = _HOME_TYPES.difference(home_type)
+            filter_state.update(dict.fromkeys(
+                (_IS_KEYS[opt] for opt in diff), _VALUE_FALSE))
 
-        if hoa:
+        if hoa is not None:
             filter_state["hoa"] = {"max": hoa}
 
-        if parking_spots:
+        if parking_spots is not None:
             filter_state["parkingSpots"] = {"min": parking_spots}
 
         if features:
-            feature_dict = {
-                "Garage": "hasGarage",
-                "BasementFinished": "isBasementFinished",
-                "BasementUnfinished": "isBasementUnfinished",
-                "SingleStory": "singleStory",
-                "AgeRestricted55Plus": "ageRestricted55Plus",
-                "AirConditioning": "hasAirConditioning",
-                "Pool": "hasPool",
-                "Waterfront": "isWaterfront",
-                "CityView": "isCityView",
-                "ParkView": "isParkView",
-                "MountainView": "isMountainView",
-                "WaterView": "isWaterView",
-            }
-
             for f in features:
-                if f_key := feature_dict.get(f, None):
-                    filter_state[f_key] = {"value": True}
-
-        if house_sqft_max or house_sqft_min:
-            house_sqft = {}
-            if house_sqft_max:
-                house_sqft["max"] = house_sqft_max
-            if house_sqft_min:
-                house_sqft["min"] = house_sqft_min
+                if f_key := _FEATURE_KEYS.get(f, None):
+                    filter_state[f_key] = _VALUE_TRUE
 
+        if house_sqft := _min_max(house_sqft_min, house_sqft_max):
             filter_state["sqft"] = house_sqft
 
-        if lot_sqft_max or lot_sqft_min:
-            lot_sqft = {}
-            if lot_sqft_max:
-                lot_sqft["max"] = lot_sqft_max
-            if lot_sqft_min:
-                lot_sqft["min"] = lot_sqft_min
-
+        if lot_sqft := _min_max(lot_sqft_min, lot_sqft_max):
             filter_state["lotSize"] = lot_sqft
 
-        if year_built_start or year_built_end:
-            year_range = {}
-            if year_built_start:
-                year_range["min"] = year_built_start
-            if year_built_end:
-                year_range["max"] = year_built_end
-
+        if year_range := _min_max(year_built_start, year_built_end):
             filter_state["built"] = year_range
 
         if keywords:
-            filter_state["keywords"] = {
-                "value": f"{' ,'.join(keywords)}"
-            }
+            # sorted so that the same keywords always give the same params
+            filter_state["keywords"] = {"value": ", ".join(sorted(keywords))}
 
         self.sub_parms["filterState"] = filter_state
 
-        return self
-
+    @_changes_sub_parms
     def set_list_visable(self, list_visible: bool) -> 'Query':
         # TODO determine what impact this has
         self.sub_parms["isListVisible"] = list_visible
-        return self
 
+    @_changes_sub_parms
     def set_map_zoom(self, zoom: int) -> 'Query':
         # TODO determine what impact this has
         self.sub_parms["mapZoom"] = zoom
-        return self
 
     def set_wants(self, wants: dict) -> 'Query':
         # TODO make this more user friendly and determine the effect of wants
         self.wants = wants
         return self
 
-    def set_custom_region(self, region: str, url: str = defaults.URL, headers: Dict = defaults.HEADER) -> 'Query':
+    @_changes_sub_parms
+    def set_custom_region(self, region: str, url: str = defaults.URL, headers: Dict = defaults.HEADER, session: requests.Session = SESSION) -> 'Query':
         """Sets a custom region to limit query results to. This is accomplished by sending a POST request to Zillow with the region string.
 
         Args:
             region (str): A string of longitudes and latitudes in the format of 'long1,lat1|long2,lat3|...|long1,lat1'. Note that the last pair of longitude and latitude values should be the same the the first.
             url (str, optional): The zillow URL for the POST request. The default can be found within defaults.py within the Zillow module.
             headers (Dict, optional): The headers sent with the POST request. The default can be found within defaults.py within the Zillow module.
+            session (requests.Session, optional): The session to send the request with. Defaults to the shared session.SESSION.
 
         Returns:
             Query: Returns self
         """
-        payload = f"-----011000010111000001101001\r\nContent-Disposition: form-data; name=\"clipPolygon\"\r\n\r\n{region}\r\n-----011000010111000001101001--\r\n"
+        payload = _MULTIPART_PREFIX + region.encode() + _MULTIPART_SUFFIX
 
-        response = requests.request("POST", url, data=payload, headers=headers)
-        region_id = response.json()["customRegionId"]
+        response = session.post(
+            url, data=payload, headers={**headers, **_MULTIPART_CONTENT_TYPE}, timeout=defaults.TIMEOUT)
+        region_id = json_loads(response.content)["customRegionId"]
 
         self.sub_parms["customRegionId"] = region_id
-        return self
 
+    @_changes_sub_parms
     def clear_custom_region(self) -> 'Query':
         """Clears the custom region ID from the query.
 
@@ -346,8 +417,8 @@ class Query:
             Query: Returns self
         """
         self.sub_parms.pop("customRegionId")
-        return self
 
+    @_changes_sub_parms
     def clear_filter(self) -> 'Query':
         """Clears the filter state.
 
@@ -355,41 +426,134 @@ class Query:
             Query: Returns self
         """
         self.sub_parms["filterState"] = {}
-        return self
 
-    def get_params_string(self) -> str:
-        """Generates the parameters JSON string according to the values set within the query
+    def get_params_string(self, page: int | None = None) -> str:
+        """Generates the parameters JSON string according to the values set within the query. The encoding of everything but the page is cached until a set_*/clear_* method is called or wants is assigned, changes made to sub_parms or wants in place are not picked up.
+
+        Args:
+            page (int | None, optional): The page of results to generate the parameters for, without changing the page set on the query. Defaults to None (the page set by set_page).
 
         Returns:
             str: The parameters JSON string
         """
+        if self._sub_parms_json is None:
+            # everything but the pagination, which changes on every page and
+            # so is encoded separately, as the members of the JSON object
+            self._sub_parms_json = json_dumps({
+                k: v for k, v in self.sub_parms.items() if k != "pagination"
+            })[1:-1]
+
+        if self._wants_json is None:
+            self._wants_json = json_dumps(self.wants)
+
+        pagination = self.sub_parms["pagination"] if page is None else {
+            "currentPage": page}
+
+        members = f'"pagination":{json_dumps(pagination)}'
+        if self._sub_parms_json:
+            members = f'{members},{self._sub_parms_json}'
+
         return {
-            "searchQueryState": json.dumps(self.sub_parms),
-            "wants": json.dumps(self.wants)
+            "searchQueryState": f'{{{members}}}',
+            "wants": self._wants_json
         }
 
-    def get_response(self, returns: Literal["request", "full", "results"] = "request", url: str = defaults.URL, headers: Dict = defaults.HEADER) -> Any:
+    def get_query_string(self, page: int | None = None) -> str:
+        """Generates the URL encoded query string of the parameters (see get_params_string), which is appended to the Zillow URL for the API request.
+
+        Args:
+            page (int | None, optional): The page of results to generate the query string for, without changing the page set on the query. Defaults to None (the page set by set_page).
+
+        Returns:
+            str: The URL query string
+        """
+        params = self.get_params_string(page)
+
+        # the params are already strings, so they are quoted directly rather
+        # than handing the dict to requests to encode on every request
+        return f"searchQueryState={quote_plus(params['searchQueryState'])}&wants={quote_plus(params['wants'])}"
+
+    def get_response(self, returns: Literal["request", "full", "results"] = "request", url: str = defaults.URL, headers: Dict = defaults.HEADER, session: requests.Session = SESSION) -> Any:
         """Returns the requests response object for the query with the configured params
 
         Args:
             returns ('request' | 'full' | 'results'): Sets what this should return, request -> request return object, 'full' -> full response json, 'results' -> search results list. Defaults to 'request'.
             url (str, optional): The Zillow URL for the API request. The default can be found within defaults.py within the Zillow module
             headers (Dict, optional): The headers parameters as a dictionary. The Defaults can be found within defaults.py within the Zillow module.
+            session (requests.Session, optional): The session to send the request with. Defaults to the shared session.SESSION.
 
         Returns:
             Any: Returns either a requests response object or dict or list. This is dependent on the returns parameter.
         """
 
-        r = requests.request(
-            "GET",
-            url,
+        r = session.get(
+            _with_query_string(url, self.get_query_string()),
             headers=headers,
-            params=self.get_params_string()
+            timeout=defaults.TIMEOUT
         )
 
         if returns == "request":
             return r
+        return self._parse_response(r.content, returns)
+
+    async def get_response_async(self, client: 'httpx.AsyncClient', page: int | None = None, returns: Literal["full", "results"] = "results", url: str = defaults.URL, headers: Dict = defaults.HEADER) -> Any:
+        """Async version of get_response, sending the request through the given httpx client.
+
+        Args:
+            client (httpx.AsyncClient): The httpx client to send the request with. Requires httpx to be installed.
+            page (int | None, optional): The page of results to request. Defaults to None (the page set by set_page).
+            returns ('full' | 'results'): Sets what this should return, 'full' -> full response json, 'results' -> search results list. Defaults to 'results'.
+            url (str, optional): The Zillow URL for the API request. The default can be found within defaults.py within the Zillow module
+            headers (Dict, optional): The headers parameters as a dictionary. The Defaults can be found within defaults.py within the Zillow module.
+
+        Returns:
+            Any: Returns either a dict or list. This is dependent on the returns parameter.
+        """
+
+        r = await client.get(
+            _with_query_string(url, self.get_query_string(page)),
+            headers=headers,
+            timeout=defaults.TIMEOUT
+        )
+
+        return self._parse_response(r.content, returns)
+
+    def get_responses(self, pages: Iterable[int], returns: Literal["full", "results"] = "results", concurrency: int = 8, url: str = defaults.URL, headers: Dict = defaults.HEADER) -> List[Any]:
+        """Requests many pages of results at once. The requests are sent concurrently and multiplexed over a single HTTP/2 connection. Requires httpx (with http2 support) to be installed, see the async extra. NOTE: this starts its own event loop, from within a running event loop use get_response_async instead.
+
+        Args:
+            pages (Iterable[int]): The pages of results to request. The page set on the query is left unchanged.
+            returns ('full' | 'results'): Sets what this should return for each page, 'full' -> full response json, 'results' -> search results list. Defaults to 'results'.
+            concurrency (int, optional): The maximum number of requests in flight at the same time. Defaults to 8.
+            url (str, optional): The Zillow URL for the API request. The default can be found within defaults.py within the Zillow module
+            headers (Dict, optional): The headers parameters as a dictionary. The Defaults can be found within defaults.py within the Zillow module.
+
+        Raises:
+            ImportError: httpx is not installed
+
+        Returns:
+            List[Any]: The dict or list of each page (see returns), in the same order as pages
+        """
+
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for batched requests, install with pip install .[async]")
+
+        async def fetch_all():
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(page):
+                async with semaphore:
+                    return await self.get_response_async(client, page, returns, url, headers)
+
+            async with httpx.AsyncClient(http2=True) as client:
+                return await asyncio.gather(*(fetch(page) for page in pages))
+
+        return asyncio.run(fetch_all())
+
+    @staticmethod
+    def _parse_response(content: bytes, returns: Literal["full", "results"]) -> Any:
         if returns == "full":
-            return r.json()
+            return json_loads(content)
         if returns == "results":
-            return r.json().get("cat1").get('searchResults').get('listResults')
+            return json_loads(content)["cat1"]["searchResults"]["listResults"]
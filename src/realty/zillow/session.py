@@ -0,0 +1,19 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+POOL_SIZE = 32
+# The number of connections kept alive per host
+
+RETRY = Retry(total=3, backoff_factor=0.3,
+              status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+# Retry policy for dropped connections, rate limiting (waiting as long as the
+# Retry-After header asks) and transient server errors. POST requests are not
+# retried (urllib3 default allowed methods). Once the retries run out the last
+# response is returned as is, so callers can still check its status code
+
+SESSION = requests.Session()
+# Shared session so that repeated requests to Zillow reuse the open
+# connections instead of doing a new TCP and TLS handshake every time
+SESSION.mount("https://", HTTPAdapter(pool_connections=POOL_SIZE,
+              pool_maxsize=POOL_SIZE, max_retries=RETRY))
@@ -0,0 +1,230 @@
+from contextlib import contextmanager, nullcontext
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+import pytest
+import requests
+from src.realty import zillow
+from src.realty.zillow import cache as zillow_cache
+from src.realty.zillow.session import RETRY
+
+try:
+    import vcr
+except ImportError:  # vcrpy is optional, without it the fixtures always hit the network
+    vcr = None
+
+try:
+    import requests_cache
+except ImportError:  # requests-cache is optional, only the Zillow detail pages are cached without it
+    requests_cache = None
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+# Where the recorded HTTP traffic of the fixtures is kept
+
+HTTP_CACHE_TTL = 12 * 60 * 60
+# Seconds a response cached by the test run is reused for
+
+FIXTURE_RETRIES = 3
+# Attempts at a fixture request before giving up on it, retrying on the same
+# status codes as the Zillow session, with the same exponential backoff
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-http-cache", action="store_true",
+        help="always request pages instead of reusing the responses cached by earlier test runs")
+    parser.addoption(
+        "--live", action="store_true",
+        help="run the tests that make requests to Zillow, Realtor.com and Landwatch, recording the cassettes that are missing")
+    parser.addoption(
+        "--cached", action="store_true",
+        help="reuse the listing subsets pickled by earlier --cached runs instead of requesting and parsing them again")
+
+
+def cassette_name(module_name: str, fixture_name: str) -> str:
+    """The name of the cassette a fixture records to, for example zillow_reasonable_query for the reasonable_query fixture of test_zillow.
+
+    Args:
+        module_name (str): The name of the test module the fixture is defined in
+        fixture_name (str): The name of the fixture
+
+    Returns:
+        str: The cassette name, without the .yaml extension
+    """
+
+    module_name = module_name.rpartition(".")[2].removeprefix("test_")
+    return f"{module_name}_{fixture_name}"
+
+
+def _needs_network(item) -> bool:
+    # if the item's fixtures make requests (through the cassette fixture),
+    # whether any of them can't be replayed from a recorded cassette
+    if "cassette" not in item.fixturenames:
+        return False
+    if vcr is None:
+        return True
+
+    for name, fixturedefs in item._fixtureinfo.name2fixturedefs.items():
+        # the last definition is the one that applies to the item
+        if "cassette" in fixturedefs[-1].argnames:
+            path = CASSETTE_DIR / f"{cassette_name(item.module.__name__, name)}.yaml"
+            if not path.exists():
+                return True
+
+    return False
+
+
+def pytest_collection_modifyitems(config, items):
+    # the tests that make requests outside of cassettes are marked live in the
+    # test modules, the tests depending on fixtures that have no recorded
+    # cassette to replay are marked here
+    for item in items:
+        if _needs_network(item):
+            item.add_marker(pytest.mark.live)
+
+    if config.getoption("--live"):
+        return
+
+    skip_live = pytest.mark.skip(
+        reason="makes network requests, pass --live to run (and record the missing cassettes)")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _http_cache(pytestconfig):
+    # caches the responses in .pytest_cache so that the same requests made by
+    # different test modules, or by runs shortly after, are only made once.
+    # These are the Zillow detail pages, and with requests-cache the requests
+    # made with the requests module functions (Realtor.com, Landwatch). The
+    # Zillow session is created at import so its queries are not cached.
+    # Requests made within a cassette bypass the caches (see cassette)
+    cache = getattr(pytestconfig, "cache", None)
+    if cache is None or pytestconfig.getoption("--no-http-cache"):
+        # nowhere to cache to with -p no:cacheprovider
+        yield
+        return
+
+    # with pytest-xdist every worker gets its own cache so that they don't
+    # contend over writing to the same SQLite file
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    cache_dir = cache.mkdir(f"http_cache_{worker_id}")
+
+    zillow.enable_page_cache(
+        str(cache_dir / "zillow_pages"), ttl=HTTP_CACHE_TTL)
+    if requests_cache is not None:
+        requests_cache.install_cache(
+            str(cache_dir / "requests"), backend="sqlite",
+            expire_after=HTTP_CACHE_TTL, allowable_methods=("GET", "POST"))
+
+    yield
+
+    zillow.disable_page_cache()
+    if requests_cache is not None:
+        requests_cache.uninstall_cache()
+
+
+@contextmanager
+def _without_http_cache():
+    # a response served from one of the _http_cache caches never reaches
+    # vcrpy, which would record the cassette incomplete
+    page_cache, zillow_cache.PAGE_CACHE = zillow_cache.PAGE_CACHE, None
+    try:
+        if requests_cache is None:
+            yield
+        else:
+            with requests_cache.disabled():
+                yield
+    finally:
+        zillow_cache.PAGE_CACHE = page_cache
+
+
+@contextmanager
+def _use_cassette(recorder, request):
+    name = cassette_name(request.module.__name__, request.fixturename)
+    with _without_http_cache(), recorder.use_cassette(f"{name}.yaml"):
+        yield
+
+
+@pytest.fixture(scope="session")
+def cassette():
+    """Context manager factory for recording the HTTP traffic of a fixture. On the first run the traffic is recorded to tests/cassettes/<name>.yaml (see cassette_name), after which it is replayed from there instead of hitting the network. Delete the cassette to record it again. The HTTP caches are bypassed within the cassette, so every request is recorded. Without vcrpy installed this does nothing.
+
+    Returns:
+        Callable[[pytest.FixtureRequest], ContextManager]: Takes the request of the fixture and returns the context manager to make the requests in
+    """
+
+    if vcr is None:
+        return lambda request: nullcontext()
+
+    recorder = vcr.VCR(
+        cassette_library_dir=str(CASSETTE_DIR),
+        record_mode="once",
+        filter_headers=["authorization", "cookie"],
+        match_on=["method", "scheme", "host", "path", "query", "body"],
+    )
+
+    return lambda request: _use_cassette(recorder, request)
+
+
+@pytest.fixture(scope="session")
+def cached_subset(pytestconfig):
+    """Loader for the listing subsets of the test classes. With --cached the built subset is pickled to .pytest_cache, keyed on the name and the listing URLs, and later --cached runs unpickle it instead of building it again. Without --cached (or with the cacheprovider plugin disabled) the subset is always built.
+
+    Returns:
+        Callable[[str, Iterable[str], Callable[[], Any]], Any]: Takes the subset name, the URLs of its listings and a function building it, and returns the subset
+    """
+
+    cache = getattr(pytestconfig, "cache", None)
+    if cache is None or not pytestconfig.getoption("--cached"):
+        return lambda name, urls, build: build()
+
+    cache_dir = cache.mkdir("listing_subsets")
+
+    def load_or_build(name, urls, build):
+        key = hashlib.sha1("\n".join(urls).encode()).hexdigest()[:16]
+        path = cache_dir / f"{name}_{key}.pickle"
+
+        if path.exists():
+            return pickle.loads(path.read_bytes())
+
+        subset = build()
+        try:
+            path.write_bytes(pickle.dumps(subset, pickle.HIGHEST_PROTOCOL))
+        except (pickle.PicklingError, TypeError, RecursionError):
+            # not everything parsed is picklable (lxml trees for one), such
+            # subsets are just built every run
+            path.unlink(missing_ok=True)
+
+        return subset
+
+    return load_or_build
+
+
+@pytest.fixture(scope="session")
+def retrying():
+    """Wrapper for the requests of the fixtures that aren't made through the Zillow session (which retries on its own), so that a dropped connection or a transient 429/5xx response doesn't fail every test of the module.
+
+    Returns:
+        Callable[[Callable[[], requests.Response]], requests.Response]: Takes a function making the request and returns its response, the last one if every attempt failed
+    """
+
+    def call(make_request):
+        for attempt in range(FIXTURE_RETRIES):
+            last_attempt = attempt == FIXTURE_RETRIES - 1
+
+            try:
+                response = make_request()
+            except requests.ConnectionError:
+                if last_attempt:
+                    raise
+            else:
+                if last_attempt or response.status_code not in RETRY.status_forcelist:
+                    return response
+
+            time.sleep(RETRY.backoff_factor * 2 ** attempt)
+
+    return call
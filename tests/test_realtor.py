@@ -1,24 +1,51 @@
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from src.realty.realtor import Sale_Query
 from src.realty.realtor.details import Sale
 
 
+EXPECTED_RESULT_KEYS = frozenset({'property_id', 'permalink'})
+# just the required ones
+
+SALE_METRICS = {
+    "loan_estimates": lambda p: p.get_loan_estimates(
+        p.price, round(p.price*.2), p.fips, p.state_code, p.yearly_property_tax, p.hoa_fee),
+    "estimated_monthly_payment": lambda p: p.get_estimated_monthly_payment(),
+    "noise_metrics": lambda p: p.get_noise_metrics(p.latitude, p.longitude),
+    "flood_risk": lambda p: p.get_flood_risk(p.property_id),
+    "fire_risk": lambda p: p.get_fire_risk(p.property_id),
+    "value_estimates": lambda p: p.get_value_estimates(p.property_id),
+    "nearby_home_values": lambda p: p.get_nearby_home_values(p.property_id),
+    "similar_homes": lambda p: p.get_similar_homes(p.property_id),
+    "homes_in_area_with_price": lambda p: p.get_homes_in_area_with_price(
+        p.zip, p.price*.8, p.price*1.2),
+}
+# The api calls made for each listing of TestSales, by name
+
+SUBSET_SIZE = 3
+# Number of listings TestSales checks
+
+
 @pytest.fixture(scope="module")
-def reasonable_sale_query():
-    q = Sale_Query()
-    q.set_filter_query_preset(
-        search_location="Dallas, TX"
-    )
-    return q.get_request()
+def reasonable_sale_query(cassette, retrying, request):
+    with cassette(request):
+        q = Sale_Query()
+        q.set_filter_query_preset(
+            search_location="Dallas, TX"
+        )
+        return retrying(q.get_request)
 
 
 @pytest.fixture(scope="module")
-def reasonable_sale_results():
-    q = Sale_Query()
-    q.set_filter_query_preset(
-        search_location="Dallas, TX"
-    )
-    return q.get_response('results')
+def reasonable_sale_query_json(reasonable_sale_query):
+    # parsed once, rather than by every test
+    return reasonable_sale_query.json()
+
+
+@pytest.fixture(scope="module")
+def reasonable_sale_results(reasonable_sale_query_json):
+    # the same as Sale_Query.get_response('results'), without a second request
+    return reasonable_sale_query_json.get('data', {}).get('home_search')
 
 
 class TestSalesQuery:
@@ -28,44 +55,37 @@ class TestSalesQuery:
         assert reasonable_sale_query.status_code == 200
 
     @staticmethod
-    def test_expected_json_keys(reasonable_sale_query):
-        assert list(
-            reasonable_sale_query.json().keys()
-        ) == ['data']
+    def test_expected_json_keys(reasonable_sale_query_json):
+        assert {'data'} <= reasonable_sale_query_json.keys()
 
     @staticmethod
-    def test_expected_results(reasonable_sale_query):
+    def test_expected_results(reasonable_sale_query_json):
         assert isinstance(
-            reasonable_sale_query.json(
-            )['data']['home_search']['results'],
+            reasonable_sale_query_json['data']['home_search']['results'],
             list
         )
 
     @staticmethod
-    def test_more_than_zero_results(reasonable_sale_query):
-        assert len(reasonable_sale_query.json()[
+    def test_more_than_zero_results(reasonable_sale_query_json):
+        assert len(reasonable_sale_query_json[
                    'data']['home_search']['results']) > 0
 
     @staticmethod
-    def test_expected_result_keys(reasonable_sale_query):
-        # just required ones
-        expected_keys = {'property_id', 'permalink', }
-
-        results = reasonable_sale_query.json(
-        )['data']['home_search']['results']
+    def test_expected_result_keys(reasonable_sale_query_json):
+        results = reasonable_sale_query_json['data']['home_search']['results']
 
-        assert all([
-            expected_keys - set(r.keys()) == set() for r in results
-        ])
+        assert all(EXPECTED_RESULT_KEYS.issubset(r) for r in results)
 
 
 class TestSales:
     @staticmethod
     @pytest.fixture(scope="class")
-    def sale_subset(reasonable_sale_results):
-        return [
-            Sale(f"https://www.realtor.com/realestateandhomes-detail/{r['permalink']}") for r in reasonable_sale_results['results'][:3]
-        ]
+    def sale_subset(reasonable_sale_results, cassette, request):
+        with cassette(request):
+            with ThreadPoolExecutor() as executor:
+                return list(executor.map(Sale, (
+                    f"https://www.realtor.com/realestateandhomes-detail/{r['permalink']}" for r in reasonable_sale_results['results'][:SUBSET_SIZE]
+                )))
 
     @staticmethod
     def test_init(sale_subset):
@@ -73,58 +93,59 @@ class TestSales:
         sale_subset
 
     @staticmethod
-    def test_get_loan_estimates(sale_subset):
-        p: Sale
-        for p in sale_subset:
-            assert isinstance(p.get_loan_estimates(p.price, round(
-                p.price*.2), p.fips, p.state_code, p.yearly_property_tax, p.hoa_fee), dict)
+    @pytest.fixture(scope="class")
+    def sale_metrics(sale_subset, cassette, request):
+        # every api call of every listing is made concurrently up front, the
+        # futures are kept so that a failing call only fails its own test
+        with cassette(request), ThreadPoolExecutor() as executor:
+            return {
+                (i, name): executor.submit(call, p)
+                for i, p in enumerate(sale_subset) for name, call in SALE_METRICS.items()
+            }
+
+    @staticmethod
+    @pytest.fixture(scope="class", params=range(SUBSET_SIZE))
+    def sale_index(sale_subset, request):
+        # one listing per test item, so one bad listing doesn't hide the others
+        if request.param >= len(sale_subset):
+            pytest.skip("the query returned fewer listings")
+        return request.param
+
+    @staticmethod
+    def test_get_loan_estimates(sale_metrics, sale_index):
+        assert isinstance(sale_metrics[sale_index, "loan_estimates"].result(), dict)
 
     @staticmethod
-    def test_get_estimate_monthly_payment(sale_subset):
-        p: Sale
-        for p in sale_subset:
-            assert isinstance(p.get_estimated_monthly_payment(), float)
+    def test_get_estimate_monthly_payment(sale_metrics, sale_index):
+        assert isinstance(
+            sale_metrics[sale_index, "estimated_monthly_payment"].result(), float)
 
     @staticmethod
-    def test_get_noise_metrics(sale_subset):
-        p: Sale
-        for p in sale_subset:
-            assert isinstance(p.get_noise_metrics(
-                p.latitude, p.longitude), dict)
+    def test_get_noise_metrics(sale_metrics, sale_index):
+        assert isinstance(sale_metrics[sale_index, "noise_metrics"].result(), dict)
 
     @staticmethod
-    def test_get_flood_risk(sale_subset):
-        p: Sale
-        for p in sale_subset:
-            assert isinstance(p.get_flood_risk(p.property_id), dict)
+    def test_get_flood_risk(sale_metrics, sale_index):
+        assert isinstance(sale_metrics[sale_index, "flood_risk"].result(), dict)
 
     @staticmethod
-    def test_get_fire_risk(sale_subset):
-        p: Sale
-        for p in sale_subset:
-            assert isinstance(p.get_fire_risk(p.property_id), dict)
+    def test_get_fire_risk(sale_metrics, sale_index):
+        assert isinstance(sale_metrics[sale_index, "fire_risk"].result(), dict)
 
     @staticmethod
-    def test_get_value_estimates(sale_subset):
-        p: Sale
-        for p in sale_subset:
-            assert isinstance(p.get_value_estimates(p.property_id), dict)
+    def test_get_value_estimates(sale_metrics, sale_index):
+        assert isinstance(sale_metrics[sale_index, "value_estimates"].result(), dict)
 
     @staticmethod
-    def test_get_nearby_home_values(sale_subset):
-        p: Sale
-        for p in sale_subset:
-            assert isinstance(p.get_nearby_home_values(p.property_id), list)
+    def test_get_nearby_home_values(sale_metrics, sale_index):
+        assert isinstance(
+            sale_metrics[sale_index, "nearby_home_values"].result(), list)
 
     @staticmethod
-    def test_get_similar_homes(sale_subset):
-        p: Sale
-        for p in sale_subset:
-            assert isinstance(p.get_similar_homes(p.property_id), dict)
+    def test_get_similar_homes(sale_metrics, sale_index):
+        assert isinstance(sale_metrics[sale_index, "similar_homes"].result(), dict)
 
     @staticmethod
-    def test_get_homes_in_area_with_price(sale_subset):
-        p: Sale
-        for p in sale_subset:
-            assert isinstance(p.get_homes_in_area_with_price(
-                p.zip, p.price*.8, p.price*1.2), dict)
+    def test_get_homes_in_area_with_price(sale_metrics, sale_index):
+        assert isinstance(
+            sale_metrics[sale_index, "homes_in_area_with_price"].result(), dict)
@@ -1,54 +1,86 @@
+import json
 import pytest
 import random
+import requests
+import numpy as np
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 from numbers import Number
 from src.realty.zillow import Query
+from src.realty.zillow.cache import Page_Cache
 from src.realty.zillow.details import details_page
+from src.realty.zillow.details import scrape as scrape_module
 from src.realty.zillow.details import Sale, Rental_Home, Rental_Apartment
 from src.realty.zillow import scrape_listing, scrape_listings, lazy_scrape_listings
 
 # Since there is no great source of truth, the goal of the tests here are for the most part just to ensure errors are not encountered when dealing with typical listings/queries
 
 
-@pytest.fixture(scope="module")
-def reasonable_query():
-    q = Query()
+EXPECTED_RESULT_KEYS = frozenset({'zpid', 'detailUrl', 'statusType'})
+# just the required ones
+
+SUBSET_SIZE = 3
+# Number of listings the detail page test classes check
+
+
+COLUMBUS_MAP_BOUNDS = dict(
+    west=-83.33248072216797, east=-82.66751927783203,
+    south=39.66914522069816, north=40.29576580257015)
+# The map bounds all the fixture queries search in
+
 
+def columbus_query(**filter_preset) -> Query:
+    """Builds the first page query for Columbus, OH that the fixtures share.
+
+    Args:
+        **filter_preset: Passed to Query.set_filter_preset, the preset is left as is when none are given
+
+    Returns:
+        Query: The query, ready for get_response
+    """
+
+    q = Query()
     q.set_page(1) \
         .set_search_term("Columbus, OH") \
-        .set_map_bounds(west=-83.33248072216797, east=-83.33248072216797, south=39.66914522069816, north=40.29576580257015)
-    return q.get_response("request")
+        .set_map_bounds(**COLUMBUS_MAP_BOUNDS)
+    if filter_preset:
+        q.set_filter_preset(**filter_preset)
+    return q
 
 
 @pytest.fixture(scope="module")
-def reasonable_sale_results():
-    q = Query()
+def reasonable_query(cassette, request):
+    with cassette(request):
+        return columbus_query().get_response("request")
 
-    q.set_page(1) \
-        .set_search_term("Columbus, OH") \
-        .set_map_bounds(west=-83.33248072216797, east=-83.33248072216797, south=39.66914522069816, north=40.29576580257015)
-    return q.get_response("results")
+
+@pytest.fixture(scope="module")
+def reasonable_query_json(reasonable_query):
+    # parsed once, rather than by every test
+    return reasonable_query.json()
 
 
 @pytest.fixture(scope="module")
-def reasonable_rental_home_results():
-    q = Query()
-    q.set_page(1) \
-        .set_search_term("Columbus, OH") \
-        .set_map_bounds(west=-83.33248072216797, east=-83.33248072216797, south=39.66914522069816, north=40.29576580257015) \
-        .set_filter_preset(for_sale=False, home_type={"SingleFamily"})
-    r = q.get_response(returns='results')
-    return [x for x in r if "homedetails" in x['detailUrl']]
+def reasonable_sale_results(reasonable_query_json):
+    # the same as Query.get_response("results"), without a second request
+    return reasonable_query_json['cat1']['searchResults']['listResults']
 
 
 @pytest.fixture(scope="module")
-def reasonable_rental_apartment_results():
-    q = Query()
-    q.set_page(1) \
-        .set_search_term("Columbus, OH") \
-        .set_map_bounds(west=-83.33248072216797, east=-83.33248072216797, south=39.66914522069816, north=40.29576580257015) \
-        .set_filter_preset(for_sale=False, home_type={"Apartment"})
-    r = q.get_response(returns='results')
-    return [x for x in r if "/b/" in x['detailUrl']]
+def reasonable_rental_home_results(cassette, request):
+    with cassette(request):
+        r = columbus_query(for_sale=False, home_type={"SingleFamily"}) \
+            .get_response(returns='results')
+        return [x for x in r if "homedetails" in x['detailUrl']]
+
+
+@pytest.fixture(scope="module")
+def reasonable_rental_apartment_results(cassette, request):
+    with cassette(request):
+        r = columbus_query(for_sale=False, home_type={"Apartment"}) \
+            .get_response(returns='results')
+        return [x for x in r if "/b/" in x['detailUrl']]
 
 
 class TestQuery:
@@ -58,33 +90,131 @@ class TestQuery:
         assert reasonable_query.status_code == 200
 
     @staticmethod
-    def test_expected_json_keys(reasonable_query):
-        assert list(
-            reasonable_query.json().keys()
-        ) == ['user', 'mapState', 'regionState', 'searchPageSeoObject', 'cat1', 'categoryTotals']
+    def test_expected_json_keys(reasonable_query_json):
+        assert {
+            'user', 'mapState', 'regionState', 'searchPageSeoObject', 'cat1', 'categoryTotals'
+        } <= reasonable_query_json.keys()
 
     @staticmethod
-    def test_expected_results(reasonable_query):
+    def test_expected_results(reasonable_query_json):
         assert isinstance(
-            reasonable_query.json()['cat1']['searchResults']['listResults'],
+            reasonable_query_json['cat1']['searchResults']['listResults'],
             list
         )
 
     @staticmethod
-    def test_more_than_zero_results(reasonable_query):
-        assert len(reasonable_query.json()[
+    def test_more_than_zero_results(reasonable_query_json):
+        assert len(reasonable_query_json[
                    'cat1']['searchResults']['listResults']) > 0
 
     @staticmethod
-    def test_expected_result_keys(reasonable_query):
-        expected_keys = {'zpid', 'detailUrl', 'statusType'}
+    def test_expected_result_keys(reasonable_query_json):
+        results = reasonable_query_json['cat1']['searchResults']['listResults']
 
-        results = reasonable_query.json().get("cat1").get(
-            'searchResults').get('listResults')
+        assert all(EXPECTED_RESULT_KEYS.issubset(r) for r in results)
 
-        assert all([
-            expected_keys - set(r.keys()) == set() for r in results
-        ])
+    @staticmethod
+    @pytest.mark.live
+    def test_get_responses():
+        pytest.importorskip("httpx")
+        q = Query().set_search_term("Columbus, OH").set_page(1)
+
+        pages = q.get_responses([1, 2])
+
+        assert len(pages) == 2
+        assert all(isinstance(results, list) for results in pages)
+        assert q.sub_parms['pagination'] == {'currentPage': 1}
+
+    @staticmethod
+    def test_get_params_string_wants_cache():
+        query = Query()
+        params = query.get_params_string()
+        assert json.loads(params['wants'])['cat2'] == ['total']
+
+        query.set_wants({'cat1': ['mapResults']})
+        assert json.loads(query.get_params_string()['wants']) == {
+            'cat1': ['mapResults']}
+
+    @staticmethod
+    def test_get_params_string_search_query_state():
+        query = Query()
+        assert json.loads(
+            query.get_params_string()['searchQueryState']) == query.sub_parms
+
+        query.set_search_term("Chattanooga, TN").set_page(3)
+        assert json.loads(
+            query.get_params_string()['searchQueryState']) == query.sub_parms
+
+        query.clear_filter().set_filter_preset(price_max=300000).set_page(4)
+        state = json.loads(query.get_params_string()['searchQueryState'])
+        assert state == query.sub_parms
+        assert state['pagination'] == {'currentPage': 4}
+
+    @staticmethod
+    def test_get_query_string():
+        query = Query().set_search_term("Columbus, OH")
+        assert query.get_query_string(2) == urlencode(
+            query.get_params_string(2))
+
+    @staticmethod
+    def test_get_response_url():
+        query = Query()
+        qs = query.get_query_string()
+        urls = []
+        session = SimpleNamespace(
+            get=lambda url, **kwargs: urls.append(url))
+
+        for url in ("https://example.com/search", "https://example.com/search?a=1", "https://example.com/search?"):
+            query.get_response(url=url, session=session)
+
+        assert urls == [
+            f"https://example.com/search?{qs}",
+            f"https://example.com/search?a=1&{qs}",
+            f"https://example.com/search?{qs}",
+        ]
+
+    @staticmethod
+    def test_set_map_bounds():
+        query = Query().set_map_bounds(west=-83.3, east=-82.7, south=39.7, north=40.3)
+        assert query.sub_parms['mapBounds'] == {
+            'west': -83.3, 'east': -82.7, 'south': 39.7, 'north': 40.3}
+
+    @staticmethod
+    def test_set_filter_preset():
+        assert Query().set_filter_preset().sub_parms['filterState'] == {
+            'isAllHomes': {'value': True}}
+
+        filter_state = Query().set_filter_preset(
+            sale_options=['ForSaleByAgent', 'RecentlySold'],
+            home_type={'Condo'},
+            features={'Pool'},
+        ).sub_parms['filterState']
+
+        assert filter_state['isForSaleByOwner'] == {'value': False}
+        assert filter_state['isRecentlySold'] == {'value': True}
+        assert filter_state['isSingleFamily'] == {'value': False}
+        assert filter_state['hasPool'] == {'value': True}
+        assert 'isForSaleByAgent' not in filter_state
+        assert 'isCondo' not in filter_state
+
+        filter_state = Query().set_filter_preset(
+            for_sale=False, price_max=2000, lot_sqft_min=5000,
+        ).sub_parms['filterState']
+
+        assert filter_state['isForRent'] == {'value': True}
+        assert filter_state['isAuction'] == {'value': False}
+        assert filter_state['price'] == {'max': 2000}
+        assert filter_state['lotSize'] == {'min': 5000}
+        assert 'sqft' not in filter_state
+
+        filter_state = Query().set_filter_preset(
+            keywords={'pool', 'fireplace'}).sub_parms['filterState']
+        assert filter_state['keywords'] == {'value': 'fireplace, pool'}
+
+        filter_state = Query().set_filter_preset(
+            hoa=0, price_min=0, price_max=100000).sub_parms['filterState']
+        assert filter_state['hoa'] == {'max': 0}
+        assert filter_state['price'] == {'min': 0, 'max': 100000}
 
 
 class TestDetailsPage:
@@ -95,15 +225,18 @@ class TestDetailsPage:
         return details_page.Details_Page.get_page(url)
 
     @staticmethod
+    @pytest.mark.live
     def test_get_page_status_code(page):
         assert page.status_code == 200
 
     @staticmethod
+    @pytest.mark.live
     def test_make_soup(page):
         # This is just to test that no exceptions occur
         details_page.Details_Page.make_soup(page)
 
     @staticmethod
+    @pytest.mark.live
     def test_get_walk_and_bike_score(reasonable_sale_results):
         zpid = reasonable_sale_results[0]['zpid']
 
@@ -114,7 +247,32 @@ class TestDetailsPage:
         assert 'walkScore' in wb_result['property']
         assert 'bikeScore' in wb_result['property']
 
+    @staticmethod
+    @pytest.mark.live
+    def test_get_walk_and_bike_scores(reasonable_sale_results):
+        pytest.importorskip("httpx")
+        zpids = [r['zpid'] for r in reasonable_sale_results[:3]]
 
+        wb_results = details_page.Details_Page.get_walk_and_bike_scores(zpids)
+
+        assert len(wb_results) == len(zpids)
+        for wb_result in wb_results:
+            assert 'walkScore' in wb_result['property']
+
+    @staticmethod
+    def test_parse_lot_size():
+        parse = details_page.Details_Page.parse_lot_size
+
+        assert parse("2 Acres") == 2 * 43560
+        assert parse("1.5 Acres") == 1.5 * 43560
+        assert parse("10,890 sqft") == 10890
+        assert parse(None) is None
+
+        with pytest.raises(ValueError):
+            parse("unknown")
+
+
+@pytest.mark.live
 class TestNextJSDetailsPage:
     @staticmethod
     @pytest.fixture(scope="class")
@@ -146,10 +304,20 @@ class TestNextJSDetailsPage:
 class TestPreloadDetailsPage:
     @staticmethod
     @pytest.fixture(scope="class")
-    def preload_details_subset(reasonable_sale_results):
-        return [
-            details_page.Preload_Detail_Page(r['detailUrl']) for r in reasonable_sale_results[:3]
-        ]
+    def preload_details_subset(reasonable_sale_results, cassette, cached_subset, request):
+        urls = [r['detailUrl'] for r in reasonable_sale_results[:SUBSET_SIZE]]
+        with cassette(request):
+            return cached_subset(
+                "zillow_preload_details", urls,
+                lambda: details_page.Preload_Detail_Page.bulk(urls))
+
+    @staticmethod
+    @pytest.fixture(scope="class", params=range(SUBSET_SIZE))
+    def preload_details(preload_details_subset, request):
+        # one listing per test item, so one bad listing doesn't hide the others
+        if request.param >= len(preload_details_subset):
+            pytest.skip("the query returned fewer listings")
+        return preload_details_subset[request.param]
 
     @staticmethod
     def test_init(preload_details_subset):
@@ -157,28 +325,134 @@ class TestPreloadDetailsPage:
         preload_details_subset
 
     @staticmethod
-    def test_get_at_a_glance(preload_details_subset):
-        for p in preload_details_subset:
-            assert isinstance(p.get_at_a_glance(), dict)
+    def test_get_api_preload_from_page():
+        page = SimpleNamespace(content=b"""<html><body>
+            <script>var x = 1 < 2;</script>
+            <script id="hdpApolloPreloadedData" type="application/json">{"zpid": 1, "apiCache": "{\\"VariantQuery\\": {}, \\"FullRenderQuery\\": {\\"property\\": {}}}"}</script>
+            </body></html>""")
+
+        preload = details_page.Preload_Detail_Page.get_api_preload_from_page(
+            page)
+
+        assert preload['zpid'] == 1
+        assert preload['apiCache'] == {
+            'VariantQuery': {}, 'FullRenderQuery': {'property': {}}}
+
+        assert details_page.Preload_Detail_Page.get_api_preload(
+            page.content) == preload
+        assert details_page.Preload_Detail_Page.get_api_preload(
+            details_page.Details_Page.make_soup(page)) == preload
+
+        with pytest.raises(ValueError):
+            details_page.Preload_Detail_Page.get_api_preload(b"<html></html>")
 
     @staticmethod
-    def test_get_tags(preload_details_subset):
-        for p in preload_details_subset:
-            assert isinstance(p.get_tags(), list)
+    def test_get_cache_from_preload():
+        preload = {'apiCache': {
+            'VariantQuery': {'variant': True},
+            'SomeOtherQuery': {},
+            'FullRenderQuery': {'property': {}},
+        }}
+
+        assert details_page.Preload_Detail_Page.get_cache_from_preload(
+            preload, 'Variant') == {'variant': True}
+        assert details_page.Preload_Detail_Page.get_cache_from_preload(
+            preload, 'Full') == {'property': {}}
+
+        with pytest.raises(KeyError):
+            details_page.Preload_Detail_Page.get_cache_from_preload(
+                {'apiCache': {}}, 'Full')
 
     @staticmethod
-    def test_get_facts_and_features(preload_details_subset):
-        for p in preload_details_subset:
-            assert isinstance(p.get_facts_and_features(), dict)
+    def test_get_variant_and_full_from_preload():
+        preload = {'apiCache': {
+            'VariantQuery': {'variant': True},
+            'FullRenderQuery': {'property': {}},
+            'SomeOtherQuery': {},
+        }}
+
+        assert details_page.Preload_Detail_Page.get_variant_and_full_from_preload(
+            preload) == ({'variant': True}, {'property': {}})
+
+        with pytest.raises(KeyError):
+            details_page.Preload_Detail_Page.get_variant_and_full_from_preload(
+                {'apiCache': {'VariantQuery': {}}})
+
+    @staticmethod
+    def test_get_at_a_glance(preload_details):
+        assert isinstance(preload_details.get_at_a_glance(), dict)
+
+    @staticmethod
+    def test_get_at_a_glance_from_reso_facts():
+        page = object.__new__(details_page.Preload_Detail_Page)
+        page.property = {'resoFacts': {'atAGlanceFacts': [
+            {'factLabel': 'Type', 'factValue': 'SingleFamily'},
+            {'factLabel': 'Year Built', 'factValue': '1990'},
+        ]}}
+
+        assert page.get_at_a_glance() == {
+            'Type': 'SingleFamily', 'Year Built': '1990'}
+        assert page.at_a_glance is page.at_a_glance
+
+        page = object.__new__(details_page.Preload_Detail_Page)
+        page.property = {'resoFacts': {'atAGlanceFacts': None}}
+
+        assert page.get_at_a_glance() == {}
+
+    @staticmethod
+    def test_concat_tax_history():
+        pytest.importorskip("pandas")
+
+        pages = []
+        for zpid, history in [(1, [{'time': 1, 'taxPaid': 10.0}, {'time': 2, 'taxPaid': 11.0}]), (2, [{'time': 1, 'taxPaid': 5.0}])]:
+            page = object.__new__(details_page.Preload_Detail_Page)
+            page.zpid = zpid
+            page.property = {'taxHistory': history}
+            pages.append(page)
+
+        assert pages[0].tax_history_df['taxPaid'].tolist() == [10.0, 11.0]
+
+        combined = details_page.Preload_Detail_Page.concat_tax_history(pages)
+        assert combined['zpid'].tolist() == [1, 1, 2]
+        assert combined['taxPaid'].tolist() == [10.0, 11.0, 5.0]
+
+    @staticmethod
+    def test_get_tags(preload_details):
+        assert isinstance(preload_details.get_tags(), list)
+
+    @staticmethod
+    def test_get_facts_and_features(preload_details):
+        assert isinstance(preload_details.get_facts_and_features(), dict)
+
+    @staticmethod
+    def test_get_facts_and_features_from_tree():
+        page = object.__new__(details_page.Preload_Detail_Page)
+        page.page = SimpleNamespace(content="""<html><body>
+            <div class="jCOrgb"><h5>Interior</h5>
+                <div><h6>Bedrooms</h6><ul><li>Bedrooms: 3</li><li>Baths: <span>2</span></li></ul></div>
+                <div><h6>Heating</h6><ul><li>Forced air</li></ul></div>
+            </div>
+            </body></html>""".encode())
+
+        assert page.get_facts_and_features() == {'Interior': {
+            'Bedrooms': ['Bedrooms: 3', 'Baths: 2'], 'Heating': ['Forced air']}}
 
 
 class TestSale:
     @staticmethod
     @pytest.fixture(scope="class")
-    def sale_subset(reasonable_sale_results):
-        return [
-            Sale(r['detailUrl']) for r in reasonable_sale_results[:3]
-        ]
+    def sale_subset(reasonable_sale_results, cassette, cached_subset, request):
+        urls = [r['detailUrl'] for r in reasonable_sale_results[:SUBSET_SIZE]]
+        with cassette(request):
+            return cached_subset("zillow_sale", urls, lambda: Sale.bulk(urls))
+
+    @staticmethod
+    @pytest.fixture(scope="class", params=range(SUBSET_SIZE))
+    def sale(sale_subset, request):
+        # one listing per test item, so one bad listing doesn't hide the others
+        if request.param >= len(sale_subset):
+            pytest.skip("the query returned fewer listings")
+        return sale_subset[request.param]
 
     @staticmethod
     def test_init(sale_subset):
@@ -186,107 +460,272 @@ class TestSale:
         sale_subset
 
     @staticmethod
-    def test_get_likely_to_sell(sale_subset):
-        for p in sale_subset:
-            assert isinstance(p.get_likely_to_sell(), (str, type(None)))
+    @pytest.mark.live
+    def test_bulk(reasonable_sale_results):
+        urls = [r['detailUrl'] for r in reasonable_sale_results[:3]]
+        sales = Sale.bulk(urls, max_workers=3)
+
+        assert [s.url for s in sales] == urls
+        assert all(isinstance(s, Sale) for s in sales)
+
+    @staticmethod
+    def test_get_likely_to_sell(sale):
+        assert isinstance(sale.get_likely_to_sell(), (str, type(None)))
+
+    @staticmethod
+    def test_calculate_monthly_mortgage_zero_interest():
+        assert Sale.calculate_monthly_mortgage(120000, 0, 360) == 120000 / 360
+
+    @staticmethod
+    def test_calculate_monthly_mortgage_vec():
+        principal = np.array([200000, 300000, 120000])
+        interest = np.array([0.06, 0.045, 0]) / 12
+
+        expected = [
+            Sale.calculate_monthly_mortgage(p, i, 360) for p, i in zip(principal[:2], interest[:2])
+        ] + [120000 / 360]
+
+        assert np.allclose(
+            Sale.calculate_monthly_mortgage_vec(principal, interest, 360),
+            expected
+        )
+
+    @staticmethod
+    def test_get_monthly_estimated_cost_zero_interest():
+        sale = object.__new__(Sale)
+        sale.property = {'price': 360000,
+                         'mortgageRates': {'thirtyYearFixedRate': 6.5}}
+
+        assert sale.get_monthly_estimated_cost(
+            60000, interest=0, tax=0, home_insurance=0, hoa_fee=0) == 300000 / 360
+
+    @staticmethod
+    def test_monthly_cost_grid():
+        sale = object.__new__(Sale)
+        sale.property = {'price': 300000, 'propertyTaxRate': 1.2,
+                         'monthlyHoaFee': 50}
+
+        downs, rates = [60000, 30000, 0], [0.065, 0.05]
+        grid = sale.monthly_cost_grid(downs, rates)
+
+        assert grid.shape == (3, 2)
+        assert np.allclose(grid, [
+            [sale.get_monthly_estimated_cost(d, r) for r in rates] for d in downs
+        ])
 
     @staticmethod
-    def test_get_monthly_estimated_cost(sale_subset):
+    def test_get_monthly_estimated_cost(sale):
         # this is primarily to test if function runs without error as opposed
         # to function calculation validity
-        for p in sale_subset:
-            assert isinstance(
-                p.get_monthly_estimated_cost(p.price*.2),
-                Number
-            )
+        assert isinstance(
+            sale.get_monthly_estimated_cost(sale.price*.2),
+            Number
+        )
 
 
 class TestRentalHome:
     @staticmethod
     @pytest.fixture(scope="class")
-    def rental_subset(reasonable_rental_home_results):
-        return [
-            Rental_Home(r['detailUrl']) for r in reasonable_rental_home_results[:3]
-        ]
+    def rental_subset(reasonable_rental_home_results, cassette, cached_subset, request):
+        urls = [r['detailUrl'] for r in reasonable_rental_home_results[:SUBSET_SIZE]]
+        with cassette(request):
+            return cached_subset(
+                "zillow_rental_home", urls, lambda: Rental_Home.bulk(urls))
+
+    @staticmethod
+    @pytest.fixture(scope="class", params=range(SUBSET_SIZE))
+    def rental_home(rental_subset, request):
+        # one listing per test item, so one bad listing doesn't hide the others
+        if request.param >= len(rental_subset):
+            pytest.skip("the query returned fewer listings")
+        return rental_subset[request.param]
 
     @staticmethod
     def test_init(rental_subset):
         # just a basic check if init doesn't run into errors
         rental_subset
 
+    @staticmethod
+    def test_fees_and_dues(rental_home):
+        assert isinstance(rental_home.fees_and_dues, (list, type(None)))
+
 
 class TestRentalApartment:
     @staticmethod
     @pytest.fixture(scope="class")
-    def rental_subset(reasonable_rental_apartment_results):
-        return [
-            Rental_Apartment(f"https://www.zillow.com{r['detailUrl']}") for r in reasonable_rental_apartment_results[:3]
-        ]
+    def rental_apartment_subset(reasonable_rental_apartment_results, cassette, cached_subset, request):
+        urls = [
+            f"https://www.zillow.com{r['detailUrl']}" for r in reasonable_rental_apartment_results[:SUBSET_SIZE]]
+
+        def build():
+            with ThreadPoolExecutor() as executor:
+                return list(executor.map(Rental_Apartment, urls))
+
+        with cassette(request):
+            return cached_subset("zillow_rental_apartment", urls, build)
 
     @staticmethod
-    def test_init(rental_subset):
+    @pytest.fixture(scope="class", params=range(SUBSET_SIZE))
+    def rental_apartment(rental_apartment_subset, request):
+        # one listing per test item, so one bad listing doesn't hide the others
+        if request.param >= len(rental_apartment_subset):
+            pytest.skip("the query returned fewer listings")
+        return rental_apartment_subset[request.param]
+
+    @staticmethod
+    def test_init(rental_apartment_subset):
         # just a basic check if init doesn't run into errors
-        rental_subset
+        rental_apartment_subset
 
     @staticmethod
-    def test_get_key_features(rental_subset):
-        for p in rental_subset:
-            assert isinstance(p.get_key_features(), dict)
+    def test_get_key_features(rental_apartment):
+        assert isinstance(rental_apartment.get_key_features(), dict)
+
+    @staticmethod
+    def test_missing_building_attribute():
+        apartment = object.__new__(Rental_Apartment)
+        apartment.building_attributes = {'applicationFee': 25}
+
+        assert apartment.application_fee == 25
+        assert getattr(apartment, 'administrative_fee', None) is None
+        assert not hasattr(apartment, 'administrative_fee')
 
 
 class TestScrape:
     @staticmethod
-    def test_scrape_sale(reasonable_sale_results):
+    @pytest.fixture(scope="class")
+    def scraped_trio(reasonable_sale_results, reasonable_rental_home_results, reasonable_rental_apartment_results, cassette, request):
+        # one listing of each type, scraped together
+        with cassette(request):
+            return scrape_listings([
+                reasonable_sale_results[0],
+                reasonable_rental_home_results[0],
+                reasonable_rental_apartment_results[0],
+            ], max_workers=3)
+
+    @staticmethod
+    @pytest.mark.parametrize(("i", "listing_type"), [(0, Sale), (1, Rental_Home), (2, Rental_Apartment)])
+    def test_scrape_listing_types(scraped_trio, i, listing_type):
         # this checks if correct class is return and no exception occurs
-        assert isinstance(
-            scrape_listing(
-                reasonable_sale_results[0]["detailUrl"], 'FOR_SALE'),
-            Sale
-        )
+        assert isinstance(scraped_trio[i], listing_type)
 
     @staticmethod
-    def test_scrape_rental_home(reasonable_rental_home_results):
-        # this checks if correct class is return and no exception occurs
-        assert isinstance(
-            scrape_listing(
-                reasonable_rental_home_results[0]["detailUrl"], 'FOR_RENT'),
-            Rental_Home
-        )
+    @pytest.fixture(scope="class")
+    def scraped_sales(reasonable_sale_results, cassette, request):
+        with cassette(request):
+            return scrape_listings(reasonable_sale_results[:3], max_workers=3)
 
     @staticmethod
-    def test_scrape_rental_apartment(reasonable_rental_apartment_results):
-        # this checks if correct class is return and no exception occurs
-        assert isinstance(
-            scrape_listing(
-                reasonable_rental_apartment_results[0]["detailUrl"], 'FOR_RENT'),
-            Rental_Apartment
-        )
+    @pytest.fixture(scope="class")
+    def lazy_sales(reasonable_sale_results):
+        # shared by the lazy scraping tests, the listings scraped by one test
+        # are kept by it and not requested again by the next. The listings
+        # are scraped by the tests, outside of any cassette
+        return lazy_scrape_listings(reasonable_sale_results)
 
     @staticmethod
-    def test_scrape_listings(reasonable_sale_results):
-        details = scrape_listings(reasonable_sale_results[:3])
-        assert all([isinstance(x, Sale) for x in details])
+    def test_scrape_listings(scraped_sales):
+        assert all(isinstance(x, Sale) for x in scraped_sales)
 
     @staticmethod
-    def test_lazy_scraping_indexing(reasonable_sale_results):
-        lazy_details = lazy_scrape_listings(reasonable_sale_results)
+    def test_scrape_listings_empty():
+        assert scrape_listings([], delay=1, rng=random.Random(0)) == []
+
+    @staticmethod
+    def test_scrape_listings_delay(monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(scrape_module, "sleep", sleeps.append)
+        monkeypatch.setattr(
+            scrape_module, "scrape_listing", lambda detail_url, status_type: detail_url)
+
+        results = [
+            {'detailUrl': str(i), 'statusType': 'FOR_SALE'} for i in range(3)]
+        assert scrape_listings(
+            results, delay=0.5, rng=random.Random(1)) == ['0', '1', '2']
 
+        draws = random.Random(1)
+        expected = [draws.uniform(0, 0.5) for _ in range(3)]
+
+        # no wait before the first request, the later ones wait at most their
+        # drawn delay (less the time since the previous request started)
+        assert sleeps[0] == 0
+        assert len(sleeps) == 3
+        assert all(0 < s <= e for s, e in zip(sleeps[1:], expected[1:]))
+
+    @staticmethod
+    @pytest.mark.live
+    def test_lazy_scraping_indexing(lazy_sales):
         test_indexes = set(
-            [random.randrange(len(reasonable_sale_results)) for _ in range(3)])
+            [random.randrange(min(3, len(lazy_sales))) for _ in range(3)])
         for ti in test_indexes:
-            assert isinstance(lazy_details[ti], Sale)
+            assert isinstance(lazy_sales[ti], Sale)
 
     @staticmethod
-    def test_lazy_scraping_slicing(reasonable_sale_results):
-        lazy_details = lazy_scrape_listings(reasonable_sale_results)
-
-        details = lazy_details[:3]
+    @pytest.mark.live
+    def test_lazy_scraping_slicing(lazy_sales):
+        details = lazy_sales[:3]
         for d in details:
             assert isinstance(d, Sale)
 
     @staticmethod
-    def test_lazy_scraping_iterating(reasonable_sale_results):
-        lazy_details = lazy_scrape_listings(reasonable_sale_results)
-
-        for detail in lazy_details[:min(3, len(lazy_details))]:
+    @pytest.mark.live
+    def test_lazy_scraping_iterating(lazy_sales):
+        for detail in lazy_sales[:min(3, len(lazy_sales))]:
             assert isinstance(detail, Sale)
+
+    @staticmethod
+    def test_lazy_scraping_prefetch(monkeypatch):
+        scraped = []
+
+        def fake_scrape_listing(detail_url, status_type):
+            scraped.append(detail_url)
+            return SimpleNamespace(url=detail_url)
+
+        monkeypatch.setattr(
+            scrape_module, "scrape_listing", fake_scrape_listing)
+
+        lazy_details = lazy_scrape_listings([
+            {'detailUrl': str(i), 'statusType': 'FOR_SALE'} for i in range(5)
+        ])
+
+        sliced = lazy_details[1:3]
+        assert isinstance(sliced, type(lazy_details)) and scraped == []
+
+        assert [d.url for d in sliced.prefetch(max_workers=2)] == ['1', '2']
+        assert [d.url for d in lazy_details] == ['0', '1', '2', '3', '4']
+        assert sorted(scraped) == ['0', '1', '2', '3', '4']
+
+
+class TestPageCache:
+    @staticmethod
+    def make_page(content):
+        page = requests.Response()
+        page.status_code = 200
+        page._content = content
+        return page
+
+    @staticmethod
+    def test_get_and_set(tmp_path):
+        page_cache = Page_Cache(str(tmp_path / "pages"))
+
+        assert page_cache.get("https://example.com") is None
+
+        page_cache.set("https://example.com",
+                       TestPageCache.make_page(b"<html></html>"))
+        assert page_cache.get(
+            "https://example.com").content == b"<html></html>"
+
+        page_cache.close()
+
+        # persisted across instances
+        page_cache = Page_Cache(str(tmp_path / "pages"))
+        assert page_cache.get(
+            "https://example.com").content == b"<html></html>"
+
+    @staticmethod
+    def test_expired(tmp_path):
+        page_cache = Page_Cache(str(tmp_path / "pages"), ttl=-1)
+        page_cache.set("https://example.com",
+                       TestPageCache.make_page(b"<html></html>"))
+
+        assert page_cache.get("https://example.com") is None